@@ -3,12 +3,12 @@ import logging
 
 from functools import partial
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
-from homeassistant.const import CONF_DEVICES
+from homeassistant.const import CONF_DEVICES, EVENT_HOMEASSISTANT_STOP
 from .const import (
     DOMAIN,
     PLATFORMS,
@@ -19,15 +19,22 @@ from .const import (
     CONF_PORT,
     CONF_SERIAL_PORT,
     CONF_SERIAL_BAUD,
+    CONF_SERIAL_IO_THREAD,
     CONF_SLAVE_ID,
     CONF_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL_FAST,
-    DEVICE_MODE_TCPIP, DEVICE_MODE_RTU
+    CONF_WRITE_DEBOUNCE,
+    CONF_VERIFY_WRITES,
+    CONF_FAST_START,
+    DEFAULT_WRITE_DEBOUNCE,
+    DEVICE_MODE_TCPIP, DEVICE_MODE_RTU, DEVICE_MODE_UDP
 )
 
-from .coordinator import ModbusCoordinator
-from .devices.connection import TCPConnectionParams, RTUConnectionParams
-from .rtu_bus import RTUBusManager, RTUBusClient
+from .coordinator import ModbusCoordinator, WRITE_WRITTEN
+from .devices.connection import TCPConnectionParams, UDPConnectionParams, RTUConnectionParams, parse_endpoints
+from .rtu_bus import RTUBusManager, RTUBusClient, SLAVE_IDS
+from .rtu_scan import async_scan_port
+from .storage import async_get_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +42,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platform from a ConfigEntry."""
     _LOGGER.debug("Setting up configuration for Modbus Devices!")
     hass.data.setdefault(DOMAIN, {})
+    await async_get_store(hass)
 
     # Load config data
     device_mode = entry.data.get(CONF_DEVICE_MODE)
@@ -43,18 +51,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_model = entry.data.get(CONF_DEVICE_MODEL, None)
     scan_interval = entry.data[CONF_SCAN_INTERVAL]
     scan_interval_fast = entry.data[CONF_SCAN_INTERVAL_FAST]
+    write_debounce = entry.data.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE) / 1000
+    verify_writes = entry.data.get(CONF_VERIFY_WRITES, False)
 
     rtu_bus = None
 
     if device_mode == DEVICE_MODE_TCPIP:
-        ip = entry.data[CONF_IP]
-        port = entry.data[CONF_PORT]
+        # CONF_IP may hold several comma separated gateways for failover
+        endpoints = parse_endpoints(entry.data[CONF_IP], entry.data[CONF_PORT])
+        ip, port = endpoints[0]
         slave_id = entry.data[CONF_SLAVE_ID]
-        connection_params = TCPConnectionParams(ip, port, slave_id)
+        connection_params = TCPConnectionParams(ip, port, slave_id, endpoints=endpoints)
+    elif device_mode == DEVICE_MODE_UDP:
+        endpoints = parse_endpoints(entry.data[CONF_IP], entry.data[CONF_PORT])
+        ip, port = endpoints[0]
+        slave_id = entry.data[CONF_SLAVE_ID]
+        connection_params = UDPConnectionParams(ip, port, slave_id, endpoints=endpoints)
     elif device_mode == DEVICE_MODE_RTU:
         serial_port = entry.data[CONF_SERIAL_PORT]
         baudrate = entry.data[CONF_SERIAL_BAUD]
-        connection_params = RTUConnectionParams(serial_port, baudrate)
+        io_thread = entry.data.get(CONF_SERIAL_IO_THREAD, False)
+        slave_id = entry.data[CONF_SLAVE_ID]
+        connection_params = RTUConnectionParams(serial_port, baudrate, slave_id)
 
         # ----- RTU bus setup -----
         rtu_buses = hass.data.setdefault(DOMAIN, {}).setdefault("rtu_buses", {})
@@ -62,13 +80,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         if bus is None:
             # First device on this port → create bus
-            bus = RTUBusManager(hass=hass, port=serial_port, baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=3.0)
+            # Devices with another baud rate on the same port are handled by reconfiguring the port
+            bus = RTUBusManager(hass=hass, port=serial_port, baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=3.0, io_thread=io_thread)
             rtu_buses[serial_port] = bus
-        else:
-            # Validate settings
-            if not bus.matches_serial_config(baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=3.0):
-                _LOGGER.error("Serial port %s already in use with different settings", serial_port)
-                return False
 
         bus.attach(entry.entry_id)
         rtu_bus = bus  # pass bus to device / coordinator
@@ -89,12 +103,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Set up coordinator
-    coordinator = ModbusCoordinator(hass, dev, device_model, connection_params, scan_interval, scan_interval_fast, rtu_bus=rtu_bus)
+    coordinator = ModbusCoordinator(hass, dev, device_model, connection_params, scan_interval, scan_interval_fast, rtu_bus=rtu_bus, write_debounce=write_debounce, verify_writes=verify_writes)
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
-    # Might throw ConfigEntryNotReady, which should cause retry later
-    # Or ConfigEntryError, which will cause integration to halt permanently.
-    await coordinator.async_config_entry_first_refresh()
+    if entry.data.get(CONF_FAST_START, False) and await coordinator.async_setup_from_cache():
+        # Entities start from the values cached at shutdown, the first poll runs in the background
+        entry.async_create_background_task(
+            hass, _async_fast_start(coordinator, rtu_bus, connection_params.slave_id), name=f"modbus_devices first poll {name}"
+        )
+    else:
+        # Might throw ConfigEntryNotReady, which should cause retry later
+        # Or ConfigEntryError, which will cause integration to halt permanently.
+        await coordinator.async_config_entry_first_refresh()
+        _start_polling(coordinator, rtu_bus, connection_params.slave_id)
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, coordinator.handle_stop))
 
     # Forward the setup to the platforms.
     hass.async_create_task(
@@ -106,9 +129,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Register services
     hass.services.async_register(DOMAIN, "request_update",partial(service_request_update, hass))
+    hass.services.async_register(DOMAIN, "broadcast_write", partial(service_broadcast_write, hass), supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "write_values", partial(service_write_values, hass), supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "scan_bus", partial(service_scan_bus, hass), supports_response=SupportsResponse.ONLY)
     
     return True
 
+def _start_polling(coordinator: ModbusCoordinator, rtu_bus: RTUBusManager | None, slave_id: int):
+    # Devices on a shared RTU bus are polled by the bus, not by their own timers
+    if rtu_bus is not None:
+        rtu_bus.scheduler.register(coordinator, slave_id)
+    else:
+        coordinator.start_polling()
+
+    # Not before, as a coordinator whose first refresh fails is dropped without being closed
+    coordinator.start_revalidation()
+
+async def _async_fast_start(coordinator: ModbusCoordinator, rtu_bus: RTUBusManager | None, slave_id: int):
+    await coordinator.async_background_first_refresh(rtu_bus.startup_lock if rtu_bus is not None else None)
+    _start_polling(coordinator, rtu_bus, slave_id)
+
 # Service-call to update values
 async def service_request_update(hass, call: ServiceCall):
     """Handle the service call to update entities for a specific device."""
@@ -132,6 +172,63 @@ async def service_request_update(hass, call: ServiceCall):
 
     _LOGGER.warning("No coordinator found for device ID %s", device_id)
 
+# Service-call to write a value to all devices of a driver on an RTU bus
+async def service_broadcast_write(hass, call: ServiceCall) -> ServiceResponse:
+    """Broadcast a value to every device with the same driver on the bus of the given device."""
+    device_id = call.data.get("device_id")
+    key = call.data.get("key")
+    value = call.data.get("value")
+    verify = call.data.get("verify", False)
+    force = call.data.get("force", False)
+    if not device_id or key is None or value is None:
+        _LOGGER.error("Device ID, key and value are required")
+        return None
+
+    for coordinator in hass.data[DOMAIN].values():
+        if getattr(coordinator, "device_id", None) == device_id:
+            results = await coordinator.broadcast_write(key, value, verify, force)
+            return {"devices": results}
+
+    _LOGGER.warning("No coordinator found for device ID %s", device_id)
+    return None
+
+# Service-call to write several values to a device
+async def service_write_values(hass, call: ServiceCall) -> ServiceResponse:
+    """Write several datapoints of a device, packed into as few transactions as possible."""
+    device_id = call.data.get("device_id")
+    values = call.data.get("values")
+    if not device_id or not isinstance(values, dict):
+        _LOGGER.error("Device ID and a mapping of datapoints to values are required")
+        return None
+
+    for coordinator in hass.data[DOMAIN].values():
+        if getattr(coordinator, "device_id", None) == device_id:
+            results = await coordinator.write_values(values)
+            for key, (_, error) in results.items():
+                if error is not None:
+                    _LOGGER.warning("Failed to write %s on %s: %s", key, coordinator.devicename, error)
+            return {"results": {
+                key: {"status": status, "success": status == WRITE_WRITTEN, "error": error}
+                for key, (status, error) in results.items()
+            }}
+
+    _LOGGER.warning("No coordinator found for device ID %s", device_id)
+    return None
+
+# Service-call to find the slaves on an RTU bus
+async def service_scan_bus(hass, call: ServiceCall) -> ServiceResponse:
+    """Scan a serial port for answering slaves."""
+    port = call.data.get("serial_port")
+    baudrate = int(call.data.get("serial_baud", 9600))
+    first = int(call.data.get("first_slave_id", SLAVE_IDS.start))
+    last = int(call.data.get("last_slave_id", SLAVE_IDS.stop - 1))
+    if not port:
+        _LOGGER.error("Serial port is required")
+        return {"responders": []}
+
+    slave_ids = range(max(first, SLAVE_IDS.start), min(last, SLAVE_IDS.stop - 1) + 1)
+    return {"port": port, "baudrate": baudrate, "responders": await async_scan_port(hass, port, baudrate, slave_ids)}
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     _LOGGER.debug("Updating Modbus Devices entry!")
     await hass.config_entries.async_reload(entry.entry_id)
@@ -147,13 +244,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Close coordinator + devices
         coordinator = hass.data[DOMAIN].get(entry.entry_id)
         if coordinator:
+            if coordinator.rtu_bus is not None:
+                coordinator.rtu_bus.scheduler.unregister(coordinator)
             coordinator.close()
 
+            # Close the serial port when the last device on it is unloaded. Otherwise the bus
+            # moves its sensors to another device, if this one carried them.
+            rtu_bus = coordinator.rtu_bus
+            if rtu_bus is not None and await rtu_bus.detach(entry.entry_id):
+                hass.data[DOMAIN].get("rtu_buses", {}).pop(rtu_bus.port, None)
+
         # Remove entry data
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached device data of a removed entry."""
+    store = await async_get_store(hass)
+    store.remove_entry(entry.entry_id)
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
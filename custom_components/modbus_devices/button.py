@@ -41,5 +41,3 @@ class ModbusButtonEntity(ModbusBaseEntity, ButtonEntity):
             await self.coordinator.write_value(self._group, self._key, 1)
         except Exception as err:
             _LOGGER.debug("Error writing command: %s %s", self._group, self._key)         
-        finally:
-            self.async_schedule_update_ha_state(force_refresh=False)
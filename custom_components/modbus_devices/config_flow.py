@@ -11,12 +11,16 @@ from homeassistant.helpers import selector
 from typing import Any
 
 from .const import DOMAIN, CONF_DEVICE_MODE, CONF_NAME, CONF_DEVICE_MODEL, CONF_IP, CONF_PORT, CONF_SLAVE_ID, CONF_SCAN_INTERVAL, CONF_SCAN_INTERVAL_FAST
-from .const import CONF_MODE_SELECTION, CONF_ADD_TCPIP, CONF_ADD_RTU
-from .const import CONF_SERIAL_PORT, CONF_SERIAL_BAUD
-from .const import DEVICE_MODE_TCPIP, DEVICE_MODE_RTU
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_FAST
-
+from .const import CONF_MODE_SELECTION, CONF_ADD_TCPIP, CONF_ADD_RTU, CONF_ADD_UDP, CONF_SCAN_RTU
+from .const import CONF_SERIAL_PORT, CONF_SERIAL_BAUD, CONF_SERIAL_IO_THREAD
+from .const import DEVICE_MODE_TCPIP, DEVICE_MODE_RTU, DEVICE_MODE_UDP
+from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_FAST, DEVICE_MODEL_AUTO
+from .const import CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE, CONF_VERIFY_WRITES, CONF_FAST_START
+
+from .detect import async_detect_model
+from .devices.connection import ConnectionParams, TCPConnectionParams, UDPConnectionParams, RTUConnectionParams, parse_endpoints
 from .devices.helpers import get_available_drivers
+from .rtu_scan import async_scan_port
 
 CONFIG_ENTRY_NAME = "Modbus Devices"
 
@@ -28,7 +32,24 @@ DEVICE_DATA_TCPIP = {
     CONF_PORT: 502,
     CONF_SLAVE_ID: 1,
     CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
-    CONF_SCAN_INTERVAL_FAST: DEFAULT_SCAN_INTERVAL_FAST
+    CONF_SCAN_INTERVAL_FAST: DEFAULT_SCAN_INTERVAL_FAST,
+    CONF_WRITE_DEBOUNCE: DEFAULT_WRITE_DEBOUNCE,
+    CONF_VERIFY_WRITES: False,
+    CONF_FAST_START: False
+}
+
+DEVICE_DATA_UDP = {
+    CONF_DEVICE_MODE: DEVICE_MODE_UDP,
+    CONF_NAME: "",
+    CONF_DEVICE_MODEL: None,
+    CONF_IP: "192.168.1.1",
+    CONF_PORT: 502,
+    CONF_SLAVE_ID: 1,
+    CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_FAST: DEFAULT_SCAN_INTERVAL_FAST,
+    CONF_WRITE_DEBOUNCE: DEFAULT_WRITE_DEBOUNCE,
+    CONF_VERIFY_WRITES: False,
+    CONF_FAST_START: False
 }
 
 DEVICE_DATA_RTU = {
@@ -37,9 +58,13 @@ DEVICE_DATA_RTU = {
     CONF_DEVICE_MODEL: None,
     CONF_SERIAL_PORT: "",
     CONF_SERIAL_BAUD: 9600,
+    CONF_SERIAL_IO_THREAD: False,
     CONF_SLAVE_ID: 1,
     CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
-    CONF_SCAN_INTERVAL_FAST: DEFAULT_SCAN_INTERVAL_FAST
+    CONF_SCAN_INTERVAL_FAST: DEFAULT_SCAN_INTERVAL_FAST,
+    CONF_WRITE_DEBOUNCE: DEFAULT_WRITE_DEBOUNCE,
+    CONF_VERIFY_WRITES: False,
+    CONF_FAST_START: False
 }
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,6 +88,12 @@ class ModbusFlowHandler(ConfigFlow, domain=DOMAIN):
             if user_input.get(CONF_MODE_SELECTION) == CONF_ADD_RTU:
                 self.selected_mode = DEVICE_MODE_RTU 
                 return await self.async_step_add_rtu()           
+            if user_input.get(CONF_MODE_SELECTION) == CONF_ADD_UDP:
+                self.selected_mode = DEVICE_MODE_UDP
+                return await self.async_step_add_udp()
+            if user_input.get(CONF_MODE_SELECTION) == CONF_SCAN_RTU:
+                self.selected_mode = DEVICE_MODE_RTU
+                return await self.async_step_scan_rtu()
                 #errors["base"] = "mode_not_implemented"
 
         return self.async_show_form(step_id="user", data_schema=MODE_SCHEMA, errors=errors)
@@ -71,9 +102,14 @@ class ModbusFlowHandler(ConfigFlow, domain=DOMAIN):
         """Handle a flow initialized by the user, adding the integration."""
         errors = {}
 
+        placeholders = {}
+
         if user_input is not None:
             user_input[CONF_DEVICE_MODE] = DEVICE_MODE_TCPIP
-            return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            await async_resolve_device_model(self.hass, user_input, errors, placeholders)
+            if not errors:
+                return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            return self.async_show_form(step_id="add_tcpip", data_schema=await getDeviceSchema(user_input), errors=errors, description_placeholders=placeholders)
 
         # Copy ip from existing integration, just for convenience
         existing_entries = self.hass.config_entries.async_entries(DOMAIN)
@@ -86,14 +122,43 @@ class ModbusFlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(step_id="add_tcpip", data_schema=await getDeviceSchema(DEVICE_DATA_TCPIP.copy()), errors=errors)
     
+    async def async_step_add_udp(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Handle a flow initialized by the user, adding the integration."""
+        errors = {}
+
+        placeholders = {}
+
+        if user_input is not None:
+            user_input[CONF_DEVICE_MODE] = DEVICE_MODE_UDP
+            await async_resolve_device_model(self.hass, user_input, errors, placeholders)
+            if not errors:
+                return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            return self.async_show_form(step_id="add_udp", data_schema=await getDeviceSchema(user_input), errors=errors, description_placeholders=placeholders)
+
+        # Copy ip from existing integration, just for convenience
+        existing_entries = self.hass.config_entries.async_entries(DOMAIN)
+        filtered_entries = [entry for entry in existing_entries if entry.data.get(CONF_DEVICE_MODE) == DEVICE_MODE_UDP]
+        if filtered_entries:
+            last_entry = filtered_entries[-1]
+            DEVICE_DATA_UDP[CONF_DEVICE_MODEL] = last_entry.data[CONF_DEVICE_MODEL]
+            DEVICE_DATA_UDP[CONF_IP] = last_entry.data[CONF_IP]
+            DEVICE_DATA_UDP[CONF_PORT] = last_entry.data[CONF_PORT]
+
+        return self.async_show_form(step_id="add_udp", data_schema=await getDeviceSchema(DEVICE_DATA_UDP.copy()), errors=errors)
+
     async def async_step_add_rtu(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle a flow initialized by the user, adding the integration."""
         errors = {}
         ports = await async_get_ports()
 
+        placeholders = {}
+
         if user_input is not None:
             user_input[CONF_DEVICE_MODE] = DEVICE_MODE_RTU
-            return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            await async_resolve_device_model(self.hass, user_input, errors, placeholders)
+            if not errors:
+                return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            return self.async_show_form(step_id="add_rtu", data_schema=await getDeviceSchema(user_input, ports), errors=errors, description_placeholders=placeholders)
 
         # Copy ip from existing integration, just for convenience
         existing_entries = self.hass.config_entries.async_entries(DOMAIN)
@@ -104,7 +169,56 @@ class ModbusFlowHandler(ConfigFlow, domain=DOMAIN):
             DEVICE_DATA_RTU[CONF_SERIAL_PORT] = last_entry.data[CONF_SERIAL_PORT]
             DEVICE_DATA_RTU[CONF_SERIAL_BAUD] = last_entry.data[CONF_SERIAL_BAUD]
 
-        return self.async_show_form(step_id="add_rtu", data_schema=await getDeviceSchema(DEVICE_DATA_RTU.copy(), ports), errors=errors)
+        # Use the device picked from a bus scan, if any
+        defaults = {**DEVICE_DATA_RTU, **getattr(self, "scan_selection", {})}
+
+        return self.async_show_form(step_id="add_rtu", data_schema=await getDeviceSchema(defaults, ports), errors=errors)
+
+    async def async_step_scan_rtu(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Scan a serial port for slaves, to pick the device to add from the ones answering."""
+        errors = {}
+        ports = await async_get_ports()
+
+        if user_input is not None:
+            port, baudrate = user_input[CONF_SERIAL_PORT], user_input[CONF_SERIAL_BAUD]
+            try:
+                self.scan_found = await async_scan_port(self.hass, port, baudrate)
+            except Exception as exc:
+                _LOGGER.warning("Scan of %s failed: %s", port, exc)
+                errors["base"] = "scan_failed"
+            else:
+                if self.scan_found:
+                    self.scan_selection = {CONF_SERIAL_PORT: port, CONF_SERIAL_BAUD: baudrate, CONF_DEVICE_MODEL: DEVICE_MODEL_AUTO}
+                    return await self.async_step_scan_result()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(step_id="scan_rtu", data_schema=await getScanSchema(user_input or DEVICE_DATA_RTU, ports), errors=errors)
+
+    async def async_step_scan_result(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Pick one of the slaves found by the scan."""
+        if user_input is not None:
+            self.scan_selection[CONF_SLAVE_ID] = int(user_input[CONF_SLAVE_ID])
+            return await self.async_step_add_rtu()
+
+        # Mark slaves already set up on this port
+        configured = {
+            entry.data.get(CONF_SLAVE_ID)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.data.get(CONF_SERIAL_PORT) == self.scan_selection[CONF_SERIAL_PORT]
+        }
+        options = [
+            selector.SelectOptionDict(
+                value=str(found["slave_id"]),
+                label="{} ({:.0f} ms){}".format(found["slave_id"], found["latency"] * 1000, " *" if found["slave_id"] in configured else ""),
+            )
+            for found in self.scan_found
+        ]
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_SLAVE_ID): selector.SelectSelector(selector.SelectSelectorConfig(options=options)),
+            }
+        )
+        return self.async_show_form(step_id="scan_result", data_schema=data_schema)
 
 class ModbusOptionsFlowHandler(OptionsFlow):
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
@@ -112,14 +226,20 @@ class ModbusOptionsFlowHandler(OptionsFlow):
         errors = {}
         ports = await async_get_ports()
 
+        placeholders = {}
+
         if user_input is not None:
             data = {**self.config_entry.data, **user_input}
+            await async_resolve_device_model(self.hass, data, errors, placeholders)
 
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, title=data[CONF_NAME], data=data, options=self.config_entry.options,
-            )
+            if not errors:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, title=data[CONF_NAME], data=data, options=self.config_entry.options,
+                )
+
+                return self.async_create_entry(title="", data={})
 
-            return self.async_create_entry(title="", data={})
+            return self.async_show_form(step_id="init", data_schema=await getDeviceSchema(data, ports), errors=errors, description_placeholders=placeholders)
 
         return self.async_show_form(step_id="init", data_schema=await getDeviceSchema(self.config_entry.data, ports), errors=errors)
 
@@ -128,7 +248,7 @@ class ModbusOptionsFlowHandler(OptionsFlow):
 """ ################################################### """
 """                     Static schemas                  """
 """ ################################################### """
-MODE_VALUES = [CONF_ADD_TCPIP, CONF_ADD_RTU]
+MODE_VALUES = [CONF_ADD_TCPIP, CONF_ADD_RTU, CONF_ADD_UDP, CONF_SCAN_RTU]
 MODE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_MODE_SELECTION): selector.SelectSelector(
@@ -137,6 +257,8 @@ MODE_SCHEMA = vol.Schema(
     }
 )
 
+BAUD_RATES = [9600, 14400, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+
 """ ################################################### """
 """                     Dynamic schemas                 """
 """ ################################################### """
@@ -144,44 +266,61 @@ MODE_SCHEMA = vol.Schema(
 async def getDeviceSchema(user_input: dict[str, Any] | None = None, ports = None) -> vol.Schema:
     device_mode = user_input.get(CONF_DEVICE_MODE)
 
-    if device_mode == DEVICE_MODE_TCPIP:
+    if device_mode in (DEVICE_MODE_TCPIP, DEVICE_MODE_UDP):
         return await getTcpIpDeviceSchema(user_input)
     elif device_mode == DEVICE_MODE_RTU:
         return await getRtuDeviceSchema(user_input, ports)
     
     return vol.Schema({})
 
-# Schema taking device details when adding or updating tcp/ip device
+# Schema taking device details when adding or updating tcp/ip or udp device
 async def getTcpIpDeviceSchema(user_input: dict[str, Any] | None = None) -> vol.Schema:
-    DEVICE_MODELS = sorted(await get_available_drivers())
+    DEVICE_MODELS = [DEVICE_MODEL_AUTO] + sorted(await get_available_drivers())
 
     data_schema = vol.Schema(
         {
             vol.Required(CONF_NAME, description="Name", default=user_input[CONF_NAME]): cv.string,
-            vol.Required(CONF_DEVICE_MODEL, default=user_input[CONF_DEVICE_MODEL]): selector.SelectSelector(selector.SelectSelectorConfig(options=DEVICE_MODELS)),     
+            vol.Required(CONF_DEVICE_MODEL, default=user_input[CONF_DEVICE_MODEL]): selector.SelectSelector(selector.SelectSelectorConfig(options=DEVICE_MODELS, translation_key=CONF_DEVICE_MODEL)),     
             vol.Required(CONF_IP, description="IP Address", default=user_input[CONF_IP]): cv.string,
             vol.Optional(CONF_PORT, description="Port", default=user_input[CONF_PORT]): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
             vol.Optional(CONF_SLAVE_ID, description="Slave ID", default=user_input[CONF_SLAVE_ID]): vol.All(vol.Coerce(int), vol.Range(min=0, max=256)),
             vol.Optional(CONF_SCAN_INTERVAL, default=user_input[CONF_SCAN_INTERVAL]): vol.All(vol.Coerce(int), vol.Range(min=5, max=999)),
             vol.Optional(CONF_SCAN_INTERVAL_FAST, default=user_input[CONF_SCAN_INTERVAL_FAST]): vol.All(vol.Coerce(int), vol.Range(min=1, max=999)),
+            vol.Optional(CONF_WRITE_DEBOUNCE, default=user_input.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE)): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+            vol.Optional(CONF_VERIFY_WRITES, default=user_input.get(CONF_VERIFY_WRITES, False)): cv.boolean,
+            vol.Optional(CONF_FAST_START, default=user_input.get(CONF_FAST_START, False)): cv.boolean,
         }
     )
     return data_schema
 
 # Schema taking device details when adding or updating RTU device
 async def getRtuDeviceSchema(user_input: dict[str, Any] | None = None, ports = None) -> vol.Schema:
-    DEVICE_MODELS = sorted(await get_available_drivers())
-    baud_rates = [9600, 14400, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+    DEVICE_MODELS = [DEVICE_MODEL_AUTO] + sorted(await get_available_drivers())
 
     data_schema = vol.Schema(
         {
             vol.Required(CONF_NAME, description="Name", default=user_input[CONF_NAME]): cv.string,
-            vol.Required(CONF_DEVICE_MODEL, default=user_input[CONF_DEVICE_MODEL]): selector.SelectSelector(selector.SelectSelectorConfig(options=DEVICE_MODELS)),     
+            vol.Required(CONF_DEVICE_MODEL, default=user_input[CONF_DEVICE_MODEL]): selector.SelectSelector(selector.SelectSelectorConfig(options=DEVICE_MODELS, translation_key=CONF_DEVICE_MODEL)),     
             vol.Required(CONF_SERIAL_PORT, description="Serial Port", default=user_input[CONF_SERIAL_PORT]): vol.In(ports),
-            vol.Required(CONF_SERIAL_BAUD, description="Baud Rate", default=user_input[CONF_SERIAL_BAUD]): vol.In(baud_rates),
+            vol.Required(CONF_SERIAL_BAUD, description="Baud Rate", default=user_input[CONF_SERIAL_BAUD]): vol.In(BAUD_RATES),
+            vol.Optional(CONF_SERIAL_IO_THREAD, default=user_input.get(CONF_SERIAL_IO_THREAD, False)): cv.boolean,
             vol.Required(CONF_SLAVE_ID, description="Slave ID", default=user_input[CONF_SLAVE_ID]): vol.All(vol.Coerce(int), vol.Range(min=0, max=256)),
             vol.Optional(CONF_SCAN_INTERVAL, default=user_input[CONF_SCAN_INTERVAL]): vol.All(vol.Coerce(int), vol.Range(min=5, max=999)),
             vol.Optional(CONF_SCAN_INTERVAL_FAST, default=user_input[CONF_SCAN_INTERVAL_FAST]): vol.All(vol.Coerce(int), vol.Range(min=1, max=999)),
+            vol.Optional(CONF_WRITE_DEBOUNCE, default=user_input.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE)): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+            vol.Optional(CONF_VERIFY_WRITES, default=user_input.get(CONF_VERIFY_WRITES, False)): cv.boolean,
+            vol.Optional(CONF_FAST_START, default=user_input.get(CONF_FAST_START, False)): cv.boolean,
+        }
+    )
+
+    return data_schema
+
+# Schema taking the serial port to scan for slaves
+async def getScanSchema(user_input: dict[str, Any] | None = None, ports = None) -> vol.Schema:
+    data_schema = vol.Schema(
+        {
+            vol.Required(CONF_SERIAL_PORT, description="Serial Port", default=user_input[CONF_SERIAL_PORT]): vol.In(ports),
+            vol.Required(CONF_SERIAL_BAUD, description="Baud Rate", default=user_input[CONF_SERIAL_BAUD]): vol.In(BAUD_RATES),
         }
     )
 
@@ -190,6 +329,46 @@ async def getRtuDeviceSchema(user_input: dict[str, Any] | None = None, ports = N
 """ ################################################### """
 """                         HELPERS                     """
 """ ################################################### """
+async def async_resolve_device_model(hass, user_input: dict[str, Any], errors: dict, placeholders: dict) -> None:
+    """
+    Replace an "auto" device model with the detected one, or set an error if detection did not find exactly one.
+    A model matched only by its signature is preselected for the user to confirm.
+    """
+    if user_input.get(CONF_DEVICE_MODEL) != DEVICE_MODEL_AUTO:
+        return
+
+    try:
+        models, identified = await async_detect_model(hass, getConnectionParams(user_input))
+    except Exception as exc:
+        _LOGGER.warning("Could not detect device model: %s", exc)
+        errors["base"] = "cannot_connect"
+        return
+
+    if len(models) == 1 and identified:
+        user_input[CONF_DEVICE_MODEL] = models[0]
+    elif len(models) == 1:
+        user_input[CONF_DEVICE_MODEL] = models[0]
+        placeholders["models"] = models[0]
+        errors[CONF_DEVICE_MODEL] = "detect_unconfirmed"
+    elif models:
+        # Preselect the first candidate, the user confirms or picks another
+        user_input[CONF_DEVICE_MODEL] = models[0]
+        placeholders["models"] = ", ".join(models)
+        errors[CONF_DEVICE_MODEL] = "detect_ambiguous"
+    else:
+        errors[CONF_DEVICE_MODEL] = "detect_failed"
+
+def getConnectionParams(user_input: dict[str, Any]) -> ConnectionParams:
+    device_mode = user_input[CONF_DEVICE_MODE]
+    if device_mode == DEVICE_MODE_RTU:
+        return RTUConnectionParams(user_input[CONF_SERIAL_PORT], user_input[CONF_SERIAL_BAUD], user_input[CONF_SLAVE_ID])
+
+    endpoints = parse_endpoints(user_input[CONF_IP], user_input[CONF_PORT])
+    ip, port = endpoints[0]
+    if device_mode == DEVICE_MODE_UDP:
+        return UDPConnectionParams(ip, port, user_input[CONF_SLAVE_ID], endpoints=endpoints)
+    return TCPConnectionParams(ip, port, user_input[CONF_SLAVE_ID], endpoints=endpoints)
+
 async def async_get_ports():
     # Run the blocking glob call in a separate thread to avoid blocking the event loop
     try:
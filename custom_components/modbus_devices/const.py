@@ -12,15 +12,24 @@ CONF_DEVICE_MODEL: str = "device_model"
 CONF_SLAVE_ID: str = "slave_id"
 CONF_SCAN_INTERVAL: str = "scan_interval"
 CONF_SCAN_INTERVAL_FAST: str = "scan_interval_fast"
+CONF_WRITE_DEBOUNCE: str = "write_debounce"
+CONF_VERIFY_WRITES: str = "verify_writes"
+CONF_FAST_START: str = "fast_start"
+
+# Device model detected from the device instead of picked by the user
+DEVICE_MODEL_AUTO = "auto"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL: int = 300  # Seconds
 DEFAULT_SCAN_INTERVAL_FAST: int = 5  # Seconds
+DEFAULT_WRITE_DEBOUNCE: int = 200  # Milliseconds
 
 # Configuration mode selection
 CONF_MODE_SELECTION = "mode_selection"
 CONF_ADD_TCPIP = "add_tcpip"
 CONF_ADD_RTU = "add_rtu"
+CONF_ADD_UDP = "add_udp"
+CONF_SCAN_RTU = "scan_rtu"
 
 # Configuration TCIP Constants
 CONF_TCPIP: str = "tcpip"
@@ -31,8 +40,10 @@ CONF_PORT: str = "port"
 CONF_SERIAL: str = "serial"
 CONF_SERIAL_PORT: str = "serial_port"
 CONF_SERIAL_BAUD: str = "serial_baud"
+CONF_SERIAL_IO_THREAD: str = "serial_io_thread"
 
 # Device modes
 DEVICE_MODE_TCPIP = "tcpip"
 DEVICE_MODE_RTU = "rtu"
-DEVICE_MODES = [DEVICE_MODE_TCPIP, DEVICE_MODE_RTU]
\ No newline at end of file
+DEVICE_MODE_UDP = "udp"
+DEVICE_MODES = [DEVICE_MODE_TCPIP, DEVICE_MODE_RTU, DEVICE_MODE_UDP]
\ No newline at end of file
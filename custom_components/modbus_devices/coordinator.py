@@ -1,42 +1,106 @@
-import async_timeout
+import asyncio
+import contextlib
+import functools
 import copy
-import datetime as dt
+import hashlib
 import logging
+import math
+import time
 
+from homeassistant.core import Event, callback
 from homeassistant.helpers import device_registry as dr
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed, ConfigEntryNotReady, ConfigEntryError
 
+from .const import DOMAIN, CONF_DEVICE_MODE, CONF_DEVICE_MODEL, CONF_NAME, CONF_SERIAL_PORT, CONF_SERIAL_BAUD, DEVICE_MODE_RTU
 from .devices.helpers import load_device_class
-from .devices.datatypes import ModbusDefaultGroups, ModbusDatapoint
-from .devices.datatypes import EntityDataSelect, EntityDataNumber
+from .devices.const import ModbusMode, ModbusPollMode
+from .devices.datatypes import ModbusDefaultGroups, ModbusGroup, ModbusDatapoint
+from .devices.datatypes import EntityDataSelect, EntityDataNumber, EntityDataButton
 from .devices.modbusdevice import ModbusDevice
 from .entity import ModbusBaseEntity
+from .rtu_bus import BusPriority, bus_priority
+from .storage import ModbusDevicesStore
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_BUDGET = 20  # Seconds, budget for one poll cycle of the device, shared by the blocks read
+FOLLOWUP_DELAYS = (0.5, 1.0, 2.0)  # Seconds after a write to read it back, followed by the fast scan interval
+STATIC_REVALIDATE_DELAY = 300  # Seconds after startup to read cached POLL_ONCE groups again, retried as often on failure
+OFFLINE_QUEUE_SIZE = 32  # Writes kept per device while it is unreachable, the oldest is dropped first
+OFFLINE_WRITE_EXPIRY = 900  # Seconds a write is kept while the device is unreachable
+
+# Outcome of a write, per datapoint
+WRITE_WRITTEN = "written"
+WRITE_QUEUED = "queued"     # Kept until the device answers again, and dropped if it does not in time
+WRITE_FAILED = "failed"
+
+# Errors meaning the device could not be reached, rather than that it refused the write
+OFFLINE_ERRORS = (ConnectionError, ConnectionException, ModbusIOException, asyncio.TimeoutError)
+
+def values_match(actual, requested) -> bool:
+    """Compare a value read from the device with the one written, allowing for float rounding in the scaling."""
+    if isinstance(actual, (int, float)) and isinstance(requested, (int, float)):
+        return math.isclose(actual, requested, rel_tol=1e-6, abs_tol=1e-6)
+    return actual == requested
+
 class ModbusCoordinator(DataUpdateCoordinator):    
-    def __init__(self, hass, device, device_model:str, connection_params, scan_interval, scan_interval_fast, rtu_bus):
+    def __init__(self, hass, device, device_model:str, connection_params, scan_interval, scan_interval_fast, rtu_bus, write_debounce: float = 0.0, verify_writes: bool = False):
         """Initialize coordinator parent"""
         super().__init__(
             hass,
             _LOGGER,
             # Name of the data. For logging purposes.
             name="ModbusDevice: " + device.name,
-            # Polling interval. Will only be polled if there are subscribers.
-            update_interval=dt.timedelta(seconds=scan_interval),
+            # Polled by a timer of our own, on a phase of its own (see next_phase_time),
+            # or by the bus scheduler for devices on an RTU bus.
+            update_interval=None,
         )
 
         self.device_model = device_model
         self.connection_params = connection_params
         self.rtu_bus = rtu_bus
+        self._store: ModbusDevicesStore = hass.data[DOMAIN]["store"]
 
-        self._fast_poll_enabled = False
-        self._fast_poll_count = 0
         self._normal_poll_interval = scan_interval
-        self._fast_poll_interval = scan_interval_fast
+        self._followup_interval = scan_interval_fast
 
         self._device = device
 
+        # Stable offset into every poll interval, as a fraction of it, so devices don't all poll at once
+        digest = hashlib.sha1(device.id.encode()).digest()
+        self._phase = int.from_bytes(digest[:4], "big") / 2**32
+        self._unsub_poll: asyncio.TimerHandle | None = None
+        self._poll_task: asyncio.Task | None = None
+        self._closed = False    # No timers are started after close, also by tasks still running
+
+        # Read-backs after writes, by (group, first register) of the block read
+        self._followups: dict[tuple, asyncio.Task] = {}
+
+        # Values written but not yet confirmed by the device, shown by the entities meanwhile
+        self._pending_values: dict[tuple, float] = {}
+        self._entities: list[ModbusBaseEntity] = []
+
+        # Writes waiting for the debounce window to end, latest value per datapoint
+        self._write_debounce = write_debounce
+        self._verify_writes = verify_writes
+        self._pending_writes: dict[tuple, tuple[float, list[asyncio.Future]]] = {}
+        self._unsub_flush: asyncio.TimerHandle | None = None
+
+        # Writes that failed because the device was unreachable, as (value, expiry wall clock time).
+        # Persisted, and written again once the device answers.
+        self._offline_writes: dict[tuple, tuple[float, float]] = {}
+        self._offline_writes_loaded = False
+        self._offline_flush: asyncio.Task | None = None
+
+        # Groups whose latest read by the RTU bus scheduler failed
+        self._failed_groups: set[ModbusGroup] = set()
+
+        # Revalidation of POLL_ONCE values loaded from the cache
+        self._unsub_revalidate: asyncio.TimerHandle | None = None
+        self._uses_cached_static = False
+        self._revalidate_task: asyncio.Task | None = None
+
         self._modbusDevice: ModbusDevice | None = None
 
         # Storage for config selection
@@ -45,6 +109,9 @@ class ModbusCoordinator(DataUpdateCoordinator):
         self.config_value_active:ModbusBaseEntity = None
 
     async def _async_setup(self):
+        if self._modbusDevice is not None:
+            return      # Already set up by async_setup_from_cache
+
         # Load modbus device driver
         device_class = await load_device_class(self.device_model)
         if device_class is not None:
@@ -55,8 +122,41 @@ class ModbusCoordinator(DataUpdateCoordinator):
         else:
             raise ConfigEntryError
 
+        # Use the read size limit found for this endpoint earlier, if any
+        # Redundant gateways may differ, so the limit is only known when found for all of them
+        limits = [self._store.get_max_registers(key) for key in self.connection_params.endpoint_keys]
+        if None not in limits:
+            self._modbusDevice.setMaxRegistersPerRead(min(limits))
+        else:
+            # Without a limit, reads that other devices found to work need no new probe
+            accepted = [self._store.get_accepted_registers(key) for key in self.connection_params.endpoint_keys]
+            if None not in accepted:
+                self._modbusDevice.setAcceptedRegistersPerRead(min(accepted))
+
+        self._load_static_values()
+
     def close(self):
         """Close the underlying device safely."""
+        self._closed = True
+        self.save_polled_values()
+        self.stop_polling()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+        if self._unsub_revalidate is not None:
+            self._unsub_revalidate.cancel()
+            self._unsub_revalidate = None
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+        if self._unsub_flush is not None:
+            self._unsub_flush.cancel()
+            self._unsub_flush = None
+        for _, waiters in self._pending_writes.values():
+            for future in waiters:
+                future.cancel()
+        self._pending_writes.clear()
+        self._pending_values.clear()
+        for task in self._followups.values():
+            task.cancel()
         self._modbusDevice.close()
 
     @property
@@ -71,36 +171,119 @@ class ModbusCoordinator(DataUpdateCoordinator):
     def identifiers(self):
         return self._device.identifiers
 
-    def setFastPollMode(self):
-        _LOGGER.debug("Enabling fast poll mode")
-        self._fast_poll_enabled = True
-        self._fast_poll_count = 0
-        self.update_interval = dt.timedelta(seconds=self._fast_poll_interval)
-        self._schedule_refresh()
+    ################################
+    ####### Scheduled polling ######
+    ################################
+    def next_phase_time(self, interval: float) -> float:
+        """
+        Next event loop time on this device's phase of the interval.
+
+        The phase is aligned to wall clock time, so it is kept across restarts and interval
+        changes, and the devices stay spread over the interval.
+        """
+        now = time.time()
+        offset = self._phase * interval
+        next_time = (math.floor((now - offset) / interval) + 1) * interval + offset
+        return self.hass.loop.time() + (next_time - now)
+
+    def start_polling(self):
+        """Start the poll timer of a device not on an RTU bus, after the first refresh."""
+        self._schedule_poll()
+
+    def stop_polling(self):
+        if self._unsub_poll is not None:
+            self._unsub_poll.cancel()
+            self._unsub_poll = None
+
+    def _schedule_poll(self):
+        if self.rtu_bus is not None or self._closed:
+            return
+        self.stop_polling()
+        self._unsub_poll = self.hass.loop.call_at(self.next_phase_time(self._normal_poll_interval), self._handle_poll)
 
-    def setNormalPollMode(self):
-        _LOGGER.debug("Enabling normal poll mode")
-        self._fast_poll_enabled = False
-        self.update_interval = dt.timedelta(seconds=self._normal_poll_interval)
+    def _handle_poll(self):
+        self._unsub_poll = None
+        self._poll_task = self.hass.async_create_background_task(self._async_poll(), name=f"modbus_devices poll {self.devicename}")
 
+    async def _async_poll(self):
+        try:
+            await self.async_refresh()
+        finally:
+            if self._unsub_poll is None:
+                self._schedule_poll()
+
+    async def async_background_first_refresh(self, startup_lock: asyncio.Lock | None = None):
+        """
+        First poll of a device set up from the cache, retried at the scan interval until it
+        succeeds. Devices sharing a lock take turns, so a bus is not flooded at startup.
+        """
+        while True:
+            async with startup_lock or contextlib.nullcontext():
+                await self.async_refresh()
+            if self.last_update_success:
+                return
+            await asyncio.sleep(self._normal_poll_interval)
+
+    def poll_groups(self) -> list[ModbusGroup]:
+        """Groups polled periodically, for schedulers that poll group by group."""
+        return [group for group in self._modbusDevice.Datapoints if group.poll_mode == ModbusPollMode.POLL_ON]
+
+    def group_interval(self, group: ModbusGroup) -> float:
+        """Current poll interval of a group, in seconds."""
+        return group.interval or self._normal_poll_interval
+
+    async def async_poll_group(self, group: ModbusGroup):
+        """Read one group and notify listeners, used by the RTU bus scheduler."""
+        groups = self.poll_groups()
+
+        try:
+            await self._modbusDevice.readGroups([group], deadline=self.hass.loop.time() + UPDATE_BUDGET)
+        except Exception as err:
+            self._expire_offline_writes()
+            self._failed_groups.add(group)
+            if self._failed_groups.issuperset(groups):
+                # The device as a whole is not answering
+                _LOGGER.warning("Failed to update %s: %s", self.devicename, err)
+                self.async_set_update_error(err)
+            else:
+                # Only the entities of the failed blocks go unavailable, through block_status
+                self.async_update_listeners()
+            return
+
+        self._failed_groups.discard(group)
+
+        # Once per cycle, retry read-once groups that failed, e.g. on a revalidation
+        if groups and group is groups[0]:
+            await self._modbusDevice.readStaticGroups()
+
+        self.async_set_updated_data(self.data)
+        self._flush_offline_writes()
+        await self._async_update_deviceInfo()
 
     async def _async_update_data(self):
         _LOGGER.debug("Coordinator updating data for: %s", self.devicename) 
 
-        """ Counter for fast polling """
-        if self._fast_poll_enabled:
-            self._fast_poll_count += 1
-            if self._fast_poll_count > 5:
-                self.setNormalPollMode()
-
         """ Fetch data """
         try:
-            async with async_timeout.timeout(20):
-                await self._modbusDevice.readData()       
+            await self._modbusDevice.readData(deadline=self.hass.loop.time() + UPDATE_BUDGET)
         except Exception as err:
             _LOGGER.warning("Failed to update %s: %s", self.devicename, err)
+            self._expire_offline_writes()
             raise UpdateFailed from err
-        
+
+        self._load_offline_writes()
+        self._flush_offline_writes()
+        self._save_static_values()
+
+        if self._modbusDevice.probe_result is not None:
+            gateway, count, exact = self._modbusDevice.probe_result
+            self._modbusDevice.probe_result = None
+            key = self.connection_params.key if gateway is None else self.connection_params.endpoint_key(*gateway)
+            if exact:
+                self._store.set_max_registers(key, count)
+            else:
+                self._store.set_accepted_registers(key, count)
+
         await self._async_update_deviceInfo()
 
     async def _async_update_deviceInfo(self) -> None:
@@ -169,7 +352,33 @@ class ModbusCoordinator(DataUpdateCoordinator):
     ################################
     ######### Read / Write #########
     ################################   
+    def register_entity(self, entity: ModbusBaseEntity):
+        self._entities.append(entity)
+
+    def unregister_entity(self, entity: ModbusBaseEntity):
+        if entity in self._entities:
+            self._entities.remove(entity)
+
+    def _async_write_state(self, group, key):
+        """Write the state of the entities showing one datapoint, without touching the others."""
+        for entity in self._entities:
+            if entity._group == group and entity._key == key:
+                entity.async_write_ha_state()
+
+    def is_available(self, group, key) -> bool:
+        """Whether the block feeding a datapoint was read on its latest try, the device as a whole may still answer."""
+        return self._modbusDevice.datapointAvailable(group, key)
+
+    def is_pending(self, group, key) -> bool:
+        return (group, key) in self._pending_values
+
     def get_value(self, group, key):
+        """Value shown by the entities: a pending write, or else the last value of the device."""
+        if (group, key) in self._pending_values:
+            return self._pending_values[(group, key)]
+        return self.get_device_value(group, key)
+
+    def get_device_value(self, group, key):
         if group in self._modbusDevice.Datapoints:
             if key in self._modbusDevice.Datapoints[group]:
                 return self._modbusDevice.Datapoints[group][key].value
@@ -182,11 +391,396 @@ class ModbusCoordinator(DataUpdateCoordinator):
         return None
 
     async def write_value(self, group, key, value):
+        """
+        Queue a write, returning when it is done.
+
+        Writes arriving within the debounce window are written together: only the
+        latest value of each datapoint, and adjacent registers in one transaction.
+        """
         _LOGGER.debug("Write_Data: %s - %s - %s", group, key, value)
+        await self._queue_write(group, key, value)
+
+    async def write_values(self, values: dict[str, float]) -> dict[str, tuple[str, str | None]]:
+        """
+        Write several datapoints at once, looked up by key in the writable groups.
+
+        The writes are sent right away, together with any debounced writes, packed into
+        as few transactions as possible. Returns the outcome per key (WRITE_WRITTEN,
+        WRITE_QUEUED or WRITE_FAILED), with the error if there was one.
+        """
+        results: dict[str, tuple[str, str | None]] = {}
+        futures = {}
+        for key, value in values.items():
+            group = self.find_writable_group(key)
+            if group is None:
+                results[key] = (WRITE_FAILED, f"No writable datapoint '{key}'")
+                continue
+            futures[key] = self._queue_write(group, key, value)
+
+        self._flush_now()
+
+        for key, future in futures.items():
+            try:
+                results[key] = (await future, None)
+            except Exception as exc:
+                results[key] = (WRITE_FAILED, str(exc) or type(exc).__name__)
+        return results
+
+    def _queue_write(self, group, key, value) -> asyncio.Future:
+        future = self.hass.loop.create_future()
+        _, waiters = self._pending_writes.get((group, key), (None, []))
+        self._pending_writes[(group, key)] = (value, [*waiters, future])
+
+        # Show the requested value at once, until the device confirms or rejects it
+        self._pending_values[(group, key)] = value
+        self._async_write_state(group, key)
+
+        if self._unsub_flush is None:
+            self._unsub_flush = self.hass.loop.call_later(self._write_debounce, self._handle_flush)
+        return future
+
+    def _flush_now(self) -> asyncio.Task:
+        if self._unsub_flush is not None:
+            self._unsub_flush.cancel()
+        return self._handle_flush()
+
+    def _handle_flush(self) -> asyncio.Task:
+        self._unsub_flush = None
+        return self.hass.async_create_background_task(self._async_flush_writes(), name=f"modbus_devices write {self.devicename}")
+
+    async def _async_flush_writes(self):
+        pending, self._pending_writes = self._pending_writes, {}
+        if not pending:
+            return
+
         try:
-            await self._modbusDevice.writeValue(group, key, value)
+            results = await self._modbusDevice.writeValues(
+                [(group, key, value) for (group, key), (value, _) in pending.items()],
+                verify=self._verify_writes,
+            )
         except Exception as exc:
-            _LOGGER.error("Failed to write value '%s' to key '%s' in group '%s': %s", value, key, group, exc, exc_info=exc)
-            raise
+            results = {item: exc for item in pending}
+
+        for (group, key), (value, waiters) in pending.items():
+            error = results.get((group, key))
+            outcome = WRITE_WRITTEN
+            if error is not None and self._keep_offline(group, key, value, error):
+                # Written once the device answers again, the caller needs no retry
+                error, outcome = None, WRITE_QUEUED
+            elif error is not None:
+                self._offline_writes.pop((group, key), None)
+                _LOGGER.error("Failed to write value '%s' to key '%s' in group '%s': %s", value, key, group, error)
+            elif self._verify_writes:
+                self._offline_writes.pop((group, key), None)
+                # Already read back with the write, no read-backs needed
+                actual = self.get_device_value(group, key)
+                if not values_match(actual, value):
+                    _LOGGER.info("Device holds %s for key '%s' after writing %s", actual, key, value)
+            else:
+                self._offline_writes.pop((group, key), None)
+                self._schedule_followup(group, key)
+
+            # Confirmed, or rolled back to the last value read from the device. A newer
+            # write queued meanwhile, or one kept for later, keeps its value pending.
+            if (group, key) not in self._pending_writes and (group, key) not in self._offline_writes:
+                self._pending_values.pop((group, key), None)
+                self._async_write_state(group, key)
+
+            for future in waiters:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(outcome)
+
+        self._save_offline_writes()
+
+    def _schedule_followup(self, group, key):
+        """Read back a written datapoint a few times, while the rest of the device keeps its schedule."""
+        if group.poll_mode == ModbusPollMode.POLL_ON:
+            # The whole block holding the datapoint, as polled
+            block = next((block for block in self._modbusDevice.planGroup(group) if key in block.keys), None)
+            if block is None:
+                return
+            followup_key = (group, block.start)
+            read = functools.partial(self._modbusDevice.readBlock, group, block)
+        else:
+            # Only the datapoint itself, so a group that is never polled, e.g. configuration, is
+            # neither read in full nor marked unavailable when a read-back fails
+            followup_key = (group, key)
+            read = functools.partial(self._modbusDevice.readValue, group, key)
+
+        # A new write to the same block or datapoint restarts its read-backs
+        task = self._followups.pop(followup_key, None)
+        if task is not None:
+            task.cancel()
+
+        self._followups[followup_key] = self.hass.async_create_background_task(
+            self._async_followup(read, followup_key),
+            name=f"modbus_devices read-back {self.devicename}",
+        )
+
+    async def _async_followup(self, read, followup_key):
+        try:
+            delays = (*FOLLOWUP_DELAYS, self._followup_interval)
+            for delay in delays:
+                await asyncio.sleep(delay)
+                try:
+                    with bus_priority(BusPriority.READBACK):
+                        await read()
+                except Exception as err:
+                    _LOGGER.debug("Read-back of %s at %s failed: %s", self.devicename, followup_key[1], err)
+                    continue
+                self.async_set_updated_data(self.data)
+        finally:
+            if self._followups.get(followup_key) is asyncio.current_task():
+                del self._followups[followup_key]
+
+    ################################
+    ######## Cached POLL_ONCE ######
+    ################################
+    def _static_identity(self) -> dict:
+        # The cache is only used for the same driver on the same connection
+        return {"model": self.device_model, "connection": self.connection_params.key}
+
+    def _load_static_values(self):
+        snapshot = self._store.get_static_values(self.config_entry.entry_id)
+        if snapshot is None or {key: snapshot.get(key) for key in ("model", "connection")} != self._static_identity():
+            return
+
+        self._modbusDevice.loadStaticValues(snapshot["groups"])
+        _LOGGER.debug("Using cached device data for %s", self.devicename)
+        self._uses_cached_static = True
+
+    def start_revalidation(self):
+        """Schedule a read of the cached groups, once the first refresh succeeded and the coordinator is in use."""
+        if self._uses_cached_static and not self._closed and self._unsub_revalidate is None:
+            self._unsub_revalidate = self.hass.loop.call_later(STATIC_REVALIDATE_DELAY, self._handle_revalidate)
+
+    def _save_static_values(self):
+        groups = self._modbusDevice.staticValues()
+        if groups:
+            self._store.set_static_values(self.config_entry.entry_id, {**self._static_identity(), "groups": groups})
+
+    def _handle_revalidate(self):
+        self._unsub_revalidate = None
+        self._revalidate_task = self.hass.async_create_background_task(self._async_revalidate_static_values(), name=f"modbus_devices revalidate {self.devicename}")
+
+    async def _async_revalidate_static_values(self):
+        """Read the cached groups again while the bus is otherwise idle, and reload the entry if the device changed."""
+        try:
+            with bus_priority(BusPriority.BACKGROUND):
+                changed = await self._modbusDevice.revalidateStaticValues()
+        except Exception as err:
+            _LOGGER.debug("Could not revalidate cached device data of %s: %s", self.devicename, err)
+            if not self._closed:
+                self._unsub_revalidate = self.hass.loop.call_later(STATIC_REVALIDATE_DELAY, self._handle_revalidate)
+            return
+
+        if self._closed:
+            return
+        self._save_static_values()
+        if changed and not self.hass.is_stopping:
+            # Drivers set up entities and device info from these values, e.g. after a firmware update
+            _LOGGER.info("Device data of %s changed since it was cached, reloading", self.devicename)
+            self.hass.async_create_task(self.hass.config_entries.async_reload(self.config_entry.entry_id))
+
+    async def async_setup_from_cache(self) -> bool:
+        """
+        Set up the device from the values cached at the last shutdown, without reading it,
+        for fast start. Returns False if there is no usable cache, then the first refresh
+        has to be awaited as usual.
+        """
+        snapshot = self._store.get_polled_values(self.config_entry.entry_id)
+        if snapshot is None or {key: snapshot.get(key) for key in ("model", "connection")} != self._static_identity():
+            return False
+
+        await self._async_setup()
+        if not self._modbusDevice.setupFromCache(snapshot["groups"]):
+            return False
+
+        self._load_offline_writes()
+        _LOGGER.debug("Started %s from cached values", self.devicename)
+        return True
+
+    def save_polled_values(self):
+        """Cache the polled values for the next fast start, on shutdown and unload."""
+        if self._modbusDevice is None or self._modbusDevice.firstRead:
+            return      # Not read since the start, the cache is still current
+        self._store.set_polled_values(
+            self.config_entry.entry_id,
+            {**self._static_identity(), "groups": self._modbusDevice.polledValues()},
+        )
+
+    @callback
+    def handle_stop(self, event: Event):
+        self.save_polled_values()
+
+    ################################
+    ######## Offline writes ########
+    ################################
+    def _keep_offline(self, group, key, value, error) -> bool:
+        """Keep a write that failed because the device was unreachable, latest value per datapoint."""
+        if not isinstance(error, OFFLINE_ERRORS):
+            return False
+
+        # A button press is a command, not a state, so it is not replayed later
+        if isinstance(self._modbusDevice.Datapoints[group][key].entity_data, EntityDataButton):
+            return False
+
+        # Retrying the same value keeps its expiry, a new value starts over
+        queued = self._offline_writes.pop((group, key), None)
+        if queued is not None and queued[0] == value:
+            expires = queued[1]
+        else:
+            expires = time.time() + OFFLINE_WRITE_EXPIRY
+
+        if len(self._offline_writes) >= OFFLINE_QUEUE_SIZE:
+            dropped = next(iter(self._offline_writes))
+            _LOGGER.warning("Write queue of %s is full, dropping write of key '%s'", self.devicename, dropped[1])
+            self._drop_offline_write(dropped)
+
+        self._offline_writes[(group, key)] = (value, expires)
+        _LOGGER.warning("%s is unreachable, writing %s to key '%s' when it answers again: %s", self.devicename, value, key, error)
+        return True
+
+    def _drop_offline_write(self, item):
+        del self._offline_writes[item]
+        if item not in self._pending_writes:
+            self._pending_values.pop(item, None)
+            self._async_write_state(*item)
+
+    def _expire_offline_writes(self):
+        now = time.time()
+        expired = [item for item, (_, expires) in self._offline_writes.items() if expires <= now]
+        for item in expired:
+            _LOGGER.warning("Dropping write of key '%s' to %s, the device did not answer in time", item[1], self.devicename)
+            self._drop_offline_write(item)
+        if expired:
+            self._save_offline_writes()
+
+    def _flush_offline_writes(self):
+        """Write the queued values in one batch, now that the device answers again."""
+        self._expire_offline_writes()
+        if not self._offline_writes:
+            return
+        if self._offline_flush is not None and not self._offline_flush.done():
+            return
+
+        _LOGGER.info("%s answers again, writing %d queued values", self.devicename, len(self._offline_writes))
+        for item, (value, _) in self._offline_writes.items():
+            # A write queued meanwhile is newer and wins
+            if item not in self._pending_writes:
+                self._pending_writes[item] = (value, [])
+        self._offline_flush = self._flush_now()
+
+    def _load_offline_writes(self):
+        """Queued writes from before the restart, once the driver is set up, as it may add groups then."""
+        if self._offline_writes_loaded:
+            return
+        self._offline_writes_loaded = True
+
+        groups = list(self._modbusDevice.Datapoints)
+        for entry in self._store.get_write_queue(self.device_id):
+            index, key = entry["group"], entry["key"]
+            if index >= len(groups) or key not in self._modbusDevice.Datapoints[groups[index]]:
+                continue    # The driver changed meanwhile
+            self._offline_writes[(groups[index], key)] = (entry["value"], entry["expires"])
+            self._pending_values[(groups[index], key)] = entry["value"]
+
+        if self._offline_writes:
+            _LOGGER.info("%s has %d queued writes from before the restart", self.devicename, len(self._offline_writes))
+
+    def _save_offline_writes(self):
+        if not self._offline_writes_loaded:
+            return      # Would replace the queue from before the restart
+        # Groups are stored by position, which is fixed by the driver once set up. Groups
+        # compare equal by mode, so look them up by identity.
+        index = {id(group): i for i, group in enumerate(self._modbusDevice.Datapoints)}
+        self._store.set_write_queue(self.device_id, [
+            {"group": index[id(group)], "key": key, "value": value, "expires": expires}
+            for (group, key), (value, expires) in self._offline_writes.items()
+        ])
+
+    ################################
+    ########## Broadcast ###########
+    ################################
+    def bus_peers(self) -> list["ModbusCoordinator"]:
+        """Devices with the same driver on the same RTU bus, including this one."""
+        return [
+            coordinator for coordinator in self.hass.data[DOMAIN].values()
+            if isinstance(coordinator, ModbusCoordinator)
+            and coordinator.rtu_bus is not None
+            and coordinator.rtu_bus is self.rtu_bus
+            and coordinator.device_model == self.device_model
+        ]
+
+    def other_models_on_bus(self, baudrate: int) -> list[str]:
+        """
+        Names of the devices configured on the same port and baud rate with another driver.
+        A broadcast would be executed by these too. Entries that are not loaded count as well.
+        """
+        return [
+            entry.data.get(CONF_NAME, entry.title)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.data.get(CONF_DEVICE_MODE) == DEVICE_MODE_RTU
+            and entry.data.get(CONF_SERIAL_PORT) == self.rtu_bus.port
+            and entry.data.get(CONF_SERIAL_BAUD) == baudrate
+            and entry.data.get(CONF_DEVICE_MODEL) != self.device_model
+        ]
+
+    def find_writable_group(self, key) -> ModbusGroup | None:
+        for group, datapoints in self._modbusDevice.Datapoints.items():
+            if group.mode in (ModbusMode.HOLDING, ModbusMode.COILS) and key in datapoints:
+                return group
+        return None
 
-        self.setFastPollMode()
\ No newline at end of file
+    async def broadcast_write(self, key, value, verify: bool = False, force: bool = False) -> dict:
+        """
+        Write a value to every device with the same driver on the bus, using broadcast.
+
+        One broadcast is sent per baud rate in use by these devices. With verify, the
+        value is read back from each device afterwards. The reads are queued on the bus
+        together at read-back priority, so they run back-to-back ahead of routine polls.
+
+        Every slave at a baud rate executes a broadcast, so it is refused if devices with
+        another driver are configured there, unless forced.
+        """
+        if self.rtu_bus is None:
+            raise ValueError("Broadcast is only supported for devices on an RTU bus")
+
+        group = self.find_writable_group(key)
+        if group is None:
+            raise KeyError(f"No writable datapoint '{key}' on {self.devicename}")
+
+        peers = self.bus_peers()
+        baudrates = sorted({peer.connection_params.baud_rate for peer in peers})
+        others = [name for baudrate in baudrates for name in self.other_models_on_bus(baudrate)]
+        if others and not force:
+            raise ValueError(f"Broadcast would also write to devices with another driver: {', '.join(others)}")
+
+        name, kwargs = self._modbusDevice.writeRequest(group, key, value)
+
+        _LOGGER.debug("Broadcasting %s = %s to %d devices on %s", key, value, len(peers), self.rtu_bus.port)
+        for baudrate in baudrates:
+            await self.rtu_bus.async_broadcast(name, serial_cfg=self.rtu_bus.serial_config_for(baudrate), **kwargs)
+
+        # Nothing confirms a broadcast, so the cached value is only updated when read back
+        results = {peer.device_id: {"name": peer.devicename} for peer in peers}
+        if verify:
+            values = await asyncio.gather(
+                *(peer._modbusDevice.readValue(group, key) for peer in peers),
+                return_exceptions=True,
+            )
+            for peer, read in zip(peers, values):
+                if isinstance(read, Exception):
+                    _LOGGER.warning("Failed to verify broadcast on %s: %s", peer.devicename, read)
+                    results[peer.device_id].update(verified=False, error=str(read))
+                else:
+                    # Compare as registers, so scaling does not make an exact float comparison fail
+                    verified = peer._modbusDevice.writeRequest(group, key, read)[1] == kwargs
+                    results[peer.device_id].update(verified=verified, value=read)
+                    peer.async_set_updated_data(peer.data)
+
+        return results
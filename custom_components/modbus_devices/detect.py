@@ -0,0 +1,147 @@
+"""Detection of the device model behind a connection, used by the config flow."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+
+from homeassistant.core import HomeAssistant
+from pymodbus.exceptions import ModbusException
+
+from .const import DOMAIN
+from .devices.connection import ConnectionParams, RTUConnectionParams
+from .devices.const import ModbusMode
+from .devices.datatypes import ModbusSignature
+from .devices.helpers import get_available_drivers, load_device_class
+from .devices.modbusdevice import ModbusDevice
+from .rtu_bus import RTUBusManager, BusPriority, bus_priority
+
+_LOGGER = logging.getLogger(__name__)
+
+MERGE_GAP = 8   # Unused registers read between two signatures rather than making another read
+
+
+async def async_detect_model(hass: HomeAssistant, connection_params: ConnectionParams) -> tuple[list[str], bool]:
+    """
+    Drivers matching the device, most specific first, and whether the device identified itself.
+    Empty if nothing matched.
+
+    Read Device Identification (FC43) is tried first. Devices without it are
+    identified by the signatures of the drivers, read with as few requests as
+    possible by merging the register ranges of all drivers. A signature only
+    tells that some registers hold plausible values, so such matches are not
+    conclusive.
+    """
+    drivers = {}
+    for name in sorted(await get_available_drivers()):
+        device_class = await load_device_class(name)
+        if device_class is not None:
+            drivers[name] = device_class
+
+    # A port already in use is shared with the devices on it, otherwise it is opened only for detection
+    rtu_bus, own_bus = None, False
+    if isinstance(connection_params, RTUConnectionParams):
+        rtu_bus = hass.data.get(DOMAIN, {}).get("rtu_buses", {}).get(connection_params.serial_port)
+        if rtu_bus is None:
+            rtu_bus, own_bus = RTUBusManager(
+                hass=hass, port=connection_params.serial_port, baudrate=connection_params.baud_rate,
+                bytesize=8, parity="N", stopbits=1, timeout=3.0,
+            ), True
+
+    probe = ModbusDevice(connection_params, rtu_bus)
+    try:
+        with bus_priority(BusPriority.BACKGROUND):
+            await probe._client.connect()
+            matches = await _match_identification(probe, drivers)
+            identified = bool(matches)
+            if not matches:
+                matches = await _match_signatures(probe, drivers)
+    finally:
+        probe.close()
+        if own_bus:
+            await rtu_bus.async_stop()
+
+    matches = _most_specific(matches, drivers)
+    _LOGGER.debug("Detected models for %s: %s (identified: %s)", connection_params.key, matches, identified)
+    return matches, identified
+
+
+async def _match_identification(probe: ModbusDevice, drivers: dict) -> list[str]:
+    try:
+        info = await probe.readDeviceIdentification()
+    except (ModbusException, ConnectionError, asyncio.TimeoutError) as err:
+        # Some devices don't answer unsupported functions at all
+        _LOGGER.debug("Read Device Identification failed: %s", err)
+        return []
+
+    if not info:
+        return []
+
+    _LOGGER.debug("Device identification: %s", info)
+    return [name for name, device_class in drivers.items() if device_class.matchIdentification(info)]
+
+
+async def _match_signatures(probe: ModbusDevice, drivers: dict) -> list[str]:
+    signatures = {name: device_class.signature for name, device_class in drivers.items() if device_class.signature is not None}
+
+    # Read all signature registers, merged into as few requests as possible
+    registers: dict[tuple[ModbusMode, int], int] = {}
+    for mode, start, count, members in _plan_reads(signatures.values(), probe.max_registers_per_read):
+        data = await _read_registers(probe, mode, start, count)
+        if data is None and len(members) > 1:
+            # The gap between two signatures may hold unmapped registers, read them one by one
+            for signature in members:
+                datapoint = signature.datapoint
+                data = await _read_registers(probe, mode, datapoint.address, datapoint.register_count)
+                if data is not None:
+                    registers.update({(mode, datapoint.address + i): value for i, value in enumerate(data)})
+        elif data is not None:
+            registers.update({(mode, start + i): value for i, value in enumerate(data)})
+
+    matches = []
+    for name, signature in signatures.items():
+        datapoint = dataclasses.replace(signature.datapoint)
+        raw = [registers.get((signature.mode, datapoint.address + i)) for i in range(datapoint.register_count)]
+        if None in raw:
+            continue
+        try:
+            datapoint.from_modbus(raw, drivers[name].byte_order, drivers[name].word_order)
+            if signature.match(datapoint.value):
+                matches.append(name)
+        except Exception as exc:
+            _LOGGER.debug("Signature of %s could not be decoded: %s", name, exc)
+    return matches
+
+
+async def _read_registers(probe: ModbusDevice, mode: ModbusMode, start: int, count: int) -> list[int] | None:
+    """A signature read, None if it failed, so one register range the device lacks does not end detection."""
+    try:
+        return await probe.readRegisters(mode, start, count)
+    except (ModbusException, ConnectionError, asyncio.TimeoutError) as err:
+        _LOGGER.debug("Signature read of %s registers at %s failed: %s", count, start, err)
+        return None
+
+
+def _plan_reads(signatures, max_count: int) -> list[tuple[ModbusMode, int, int, list[ModbusSignature]]]:
+    """Merge signature ranges of the same mode that are close to each other."""
+    reads = []
+    by_start = sorted(signatures, key=lambda signature: (signature.mode.value, signature.datapoint.address))
+    for signature in by_start:
+        start = signature.datapoint.address
+        end = start + signature.datapoint.register_count
+        if reads:
+            mode, read_start, read_count, members = reads[-1]
+            read_end = read_start + read_count
+            if mode == signature.mode and start <= read_end + MERGE_GAP and max(end, read_end) - read_start <= max_count:
+                reads[-1] = (mode, read_start, max(end, read_end) - read_start, members + [signature])
+                continue
+        reads.append((signature.mode, start, end - start, [signature]))
+    return reads
+
+
+def _most_specific(matches: list[str], drivers: dict) -> list[str]:
+    """Drop drivers that are base classes of other matching drivers, e.g. a generic model of a family."""
+    return [
+        name for name in matches
+        if not any(other != name and issubclass(drivers[other], drivers[name]) for other in matches)
+    ]
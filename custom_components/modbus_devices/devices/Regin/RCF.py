@@ -6,6 +6,7 @@ from ..const import ModbusMode, ModbusPollMode
 from ..datatypes import (
     ModbusDatapoint,
     ModbusGroup,
+    ModbusSignature,
     ModbusDefaultGroups,
     EntityDataSensor,
     EntityDataSelect,
@@ -35,6 +36,9 @@ class Device(ModbusDevice):
     manufacturer = "Regin"
     model = "RCF"
 
+    # "Software Type" is 0 (RCP) or 1 (RC)
+    signature = ModbusSignature(ModbusMode.INPUT, ModbusDatapoint(address=1), lambda value: value in (0, 1))
+
     def loadDatapoints(self):
         # DEVICE_INFO - Read-only
         self.Datapoints[GROUP_DEVICE_INFO] = {
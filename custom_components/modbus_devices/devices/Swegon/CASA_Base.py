@@ -3,10 +3,11 @@
 ####################################################
 
 import logging
+import re
 
 from ..modbusdevice import ModbusDevice
 from ..const import ModbusMode, ModbusPollMode, ModbusDataType
-from ..datatypes import ModbusDatapoint, ModbusGroup, ModbusDefaultGroups
+from ..datatypes import ModbusDatapoint, ModbusGroup, ModbusDefaultGroups, ModbusSignature
 from ..datatypes import EntityDataSensor, EntityDataSelect, EntityDataNumber, EntityDataBinarySensor, EntityDataSwitch, EntityDataButton
 
 from homeassistant.const import UnitOfTemperature, UnitOfTime
@@ -27,10 +28,17 @@ GROUP_SENSORS = ModbusGroup(ModbusMode.INPUT, ModbusPollMode.POLL_ON)
 GROUP_UNIT_STATUSES = ModbusGroup(ModbusMode.INPUT, ModbusPollMode.POLL_ON)  
 GROUP_UI = ModbusGroup(ModbusMode.NONE, ModbusPollMode.POLL_OFF) 
 
+def model_signature(pattern: str) -> ModbusSignature:
+    """Detect a CASA model from the "Model Name" register, e.g. "CASA R7" for pattern r"R7"."""
+    regex = re.compile(rf"\b{pattern}\b", re.IGNORECASE)
+    model_name = ModbusDatapoint(address=6007, register_count=15, type=ModbusDataType.STRING1)
+    return ModbusSignature(ModbusMode.INPUT, model_name, lambda value: bool(regex.search(value)))
+
 class Device(ModbusDevice):
     # Override static device information
     manufacturer = "Swegon"
     model = "CASA"
+    signature = model_signature(r"R\d+")    # Any CASA model without a driver of its own
 
     def loadDatapoints(self):
         # COMMANDS - Read/Write
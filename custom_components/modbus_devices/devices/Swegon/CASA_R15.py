@@ -1,11 +1,12 @@
 import logging
-from .CASA_Base import GROUP_SETPOINTS, Device as BaseDevice
+from .CASA_Base import model_signature, GROUP_SETPOINTS, Device as BaseDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 class Device(BaseDevice):
     # Override static device information
     model="CASA R15"
+    signature=model_signature(r"R15")
 
     def loadDatapoints(self):
         super().loadDatapoints() 
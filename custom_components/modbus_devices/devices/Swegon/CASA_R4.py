@@ -1,11 +1,12 @@
 import logging
-from .CASA_Base import Device as BaseDevice
+from .CASA_Base import model_signature, Device as BaseDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 class Device(BaseDevice):
     # Override static device information
     manufacturer="Swegon"
+    signature=model_signature(r"R4")
 
     # Override dynamic data
     def loadDatapoints(self):
@@ -1,5 +1,5 @@
 import logging
-from .CASA_Base import GROUP_SETPOINTS, GROUP_UNIT_STATUSES, ModbusDefaultGroups, GROUP_SENSORS, GROUP_UI, Device as BaseDevice
+from .CASA_Base import model_signature, GROUP_SETPOINTS, GROUP_UNIT_STATUSES, ModbusDefaultGroups, GROUP_SENSORS, GROUP_UI, Device as BaseDevice
 from ..datatypes import ModbusDatapoint, EntityDataSensor
 from homeassistant.const import PERCENTAGE, REVOLUTIONS_PER_MINUTE
 
@@ -8,6 +8,7 @@ _LOGGER = logging.getLogger(__name__)
 class Device(BaseDevice):
     # Override static device information
     model="CASA R7"
+    signature=model_signature(r"R7")
 
     def loadDatapoints(self):
         super().loadDatapoints()
@@ -15,6 +15,7 @@ _LOGGER = logging.getLogger(__name__)
 # Define groups
 GROUP_0 = ModbusGroup(ModbusMode.HOLDING, ModbusPollMode.POLL_ON)
 GROUP_DEVICE_INFO = ModbusGroup(ModbusMode.HOLDING, ModbusPollMode.POLL_ON)
+GROUP_BUS_SETTINGS = ModbusGroup(ModbusMode.HOLDING, ModbusPollMode.POLL_ONCE, optional=True)    # Not on all firmware
 GROUP_UI = ModbusGroup(ModbusMode.HOLDING, ModbusPollMode.POLL_OFF)
 
 class Device(ModbusDevice):
@@ -41,6 +42,11 @@ class Device(ModbusDevice):
             "Status": ModbusDatapoint(address=104),
         }
 
+        # BUS SETTINGS - Read once, used for bus timing
+        self.Datapoints[GROUP_BUS_SETTINGS] = {
+            "Modbus Response Delay": ModbusDatapoint(address=569),
+        }
+
         # CONFIGURATION - Read/Write
         self.Datapoints[ModbusDefaultGroups.CONFIG] = {
             "105 Q Min Percent": ModbusDatapoint(address=105, scaling=0.01, entity_data=EntityDataNumber(units=PERCENTAGE, min_value=0, max_value=100, step=1)),
@@ -77,6 +83,10 @@ class Device(ModbusDevice):
         self.Datapoints[ModbusDefaultGroups.CONFIG]["120 Q Min"].entity_data.units = flowUnits
         self.Datapoints[ModbusDefaultGroups.CONFIG]["121 Q Max"].entity_data.units = flowUnits
 
+        # Response delay is configured in ms. Only a tuning hint, the timeout is learned without it.
+        if self.groupHasValues(GROUP_BUS_SETTINGS):
+            self.response_delay = self.Datapoints[GROUP_BUS_SETTINGS]["Modbus Response Delay"].value / 1000
+
     def onAfterRead(self):
         self.sw_version = self.Datapoints[GROUP_DEVICE_INFO]["FW"].value
 
@@ -1,15 +1,86 @@
-class ConnectionParams:
+from abc import ABC, abstractmethod
+
+
+class ConnectionParams(ABC):
     """Base class for connection parameters."""
-    pass
+
+    @property
+    @abstractmethod
+    def key(self) -> str:
+        """Stable identifier for the endpoint and slave, used for persisted per-endpoint data."""
+
+    @property
+    def endpoint_keys(self) -> list[str]:
+        """Keys of each redundant endpoint, for data that differs between gateways."""
+        return [self.key]
 
 class TCPConnectionParams(ConnectionParams):
-    def __init__(self, ip: str, port: int, slave_id: int = 1):
+    def __init__(self, ip: str, port: int, slave_id: int = 1, endpoints: list[tuple[str, int]] | None = None):
+        # ip/port is the primary endpoint, endpoints holds all redundant gateways (primary first)
+        self.ip = ip
+        self.port = port
+        self.slave_id = slave_id
+        self.endpoints = endpoints or [(ip, port)]
+
+    @property
+    def key(self) -> str:
+        hosts = ",".join(f"{host}:{port}" for host, port in self.endpoints)
+        return f"tcp://{hosts}/{self.slave_id}"
+
+    def endpoint_key(self, host: str, port: int) -> str:
+        return f"tcp://{host}:{port}/{self.slave_id}"
+
+    @property
+    def endpoint_keys(self) -> list[str]:
+        return [self.endpoint_key(host, port) for host, port in self.endpoints]
+
+class UDPConnectionParams(ConnectionParams):
+    # Modbus/UDP has no connection state, so a lost datagram is only noticed through the
+    # response timeout. On a switched LAN losses are rare and round trips are a few ms,
+    # so a short timeout with retried reads recovers faster than TCP would. Reads are
+    # retried by the device's retry policy, writes are never sent twice.
+    def __init__(self, ip: str, port: int, slave_id: int = 1, timeout: float = 0.5, endpoints: list[tuple[str, int]] | None = None):
         self.ip = ip
         self.port = port
         self.slave_id = slave_id
+        self.timeout = timeout
+        self.endpoints = endpoints or [(ip, port)]
+
+    @property
+    def key(self) -> str:
+        hosts = ",".join(f"{host}:{port}" for host, port in self.endpoints)
+        return f"udp://{hosts}/{self.slave_id}"
+
+    def endpoint_key(self, host: str, port: int) -> str:
+        return f"udp://{host}:{port}/{self.slave_id}"
+
+    @property
+    def endpoint_keys(self) -> list[str]:
+        return [self.endpoint_key(host, port) for host, port in self.endpoints]
 
 class RTUConnectionParams(ConnectionParams):
     def __init__(self, serial_port: str, baud_rate: int, slave_id: int = 1):
         self.serial_port = serial_port
         self.baud_rate = baud_rate
-        self.slave_id = slave_id
\ No newline at end of file
+        self.slave_id = slave_id
+
+    @property
+    def key(self) -> str:
+        return f"rtu://{self.serial_port}/{self.slave_id}"
+
+def parse_endpoints(value: str, default_port: int) -> list[tuple[str, int]]:
+    """Parse "host[:port], host[:port], ..." into a list of (host, port) tuples."""
+    endpoints = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, sep, port = item.rpartition(":")
+        if sep and port.isdigit():
+            endpoints.append((host, int(port)))
+        else:
+            endpoints.append((item, default_port))
+
+    if not endpoints:
+        raise ValueError(f"No endpoints found in '{value}'")
+    return endpoints
@@ -4,6 +4,7 @@ import uuid
 from .const import ByteOrder, WordOrder, ModbusDataType, ModbusMode, ModbusPollMode
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any, Callable
 
 ###########################################
 ###### DATA TYPES FOR HOME ASSISTANT ######
@@ -50,10 +51,16 @@ class EntityDataButton(EntityData):
 ###### DATA TYPES FOR MODBUS FUNCTIONALITY ######
 ################################################
 class ModbusGroup:
-    def __init__(self, mode: ModbusMode, poll_mode: ModbusPollMode):
+    def __init__(self, mode: ModbusMode, poll_mode: ModbusPollMode, interval: float | None = None, priority: int = 0, optional: bool = False):
         # Initialize mode and poll_mode
         self.mode = mode
         self.poll_mode = poll_mode
+        # Poll interval in seconds, None to use the scan interval of the device
+        self.interval = interval
+        # Higher priority groups keep their interval longer when a bus is oversubscribed
+        self.priority = priority
+        # POLL_ONCE group that may be missing on some firmware. Tried once, the setup does not wait for it.
+        self.optional = optional
         # Generate a unique ID automatically when the instance is created
         self._unique_id = str(uuid.uuid4())
 
@@ -87,6 +94,29 @@ class ModbusDefaultGroups(Enum):
     def poll_mode(self):
         return self.value.poll_mode  # Access the poll_mode property directly
 
+    @property
+    def interval(self):
+        return self.value.interval
+
+    @property
+    def priority(self):
+        return self.value.priority
+
+@dataclass
+class ModbusReadBlock:
+    """One read request planned from a group, covering one or more datapoints."""
+    start: int                                                  # First register address
+    count: int                                                  # Number of registers
+    keys: list[str] = field(default_factory=list)               # Datapoints decoded from this block
+
+@dataclass
+class ModbusBlockStatus:
+    """Outcome of the reads of one planned block, for availability and diagnostics."""
+    keys: list[str] = field(default_factory=list)               # Datapoints decoded from the block
+    last_attempt: float | None = None                           # Wall clock time of the latest read
+    last_success: float | None = None                           # Wall clock time of the latest successful read
+    error: str | None = None                                    # Error of the latest read, None if it succeeded
+
 @dataclass
 class ModbusDatapoint:
     address: int = 0                                            # 0-indexed address
@@ -186,4 +216,11 @@ class ModbusDatapoint:
             chunk = b[i:i+4]
             swapped.extend(chunk[2:4] + chunk[0:2] if len(chunk) == 4 else chunk)
 
-        return bytes(swapped)
\ No newline at end of file
+        return bytes(swapped)
+
+@dataclass(frozen=True)
+class ModbusSignature:
+    """Registers read during model detection, and a test of their value that identifies the driver."""
+    mode: ModbusMode
+    datapoint: ModbusDatapoint                                  # Address, size and type of the value
+    match: Callable[[Any], bool]                                # True if the value belongs to this model
@@ -1,19 +1,31 @@
+import asyncio
 import logging
+import time
 
+from collections import Counter
 from enum import Enum
 from homeassistant.helpers.entity import EntityCategory
 
-from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
+from pymodbus.exceptions import ModbusException, ModbusIOException
 
-from .connection import ConnectionParams, TCPConnectionParams, RTUConnectionParams
+from .connection import ConnectionParams, TCPConnectionParams, UDPConnectionParams, RTUConnectionParams
 from .const import ByteOrder, WordOrder, ModbusMode, ModbusPollMode
-from .datatypes import ModbusDefaultGroups, ModbusGroup, ModbusDatapoint
+from .datatypes import ModbusDefaultGroups, ModbusGroup, ModbusDatapoint, ModbusReadBlock, ModbusBlockStatus, ModbusSignature
 from .datatypes import EntityDataSelect, EntityDataNumber, EntityDataSensor
-from ..rtu_bus import RTUBusManager, RTUBusClient
+from .retry import TransactionClass, RETRY_POLICIES, EXCEPTION_NAMES, EXCEPTION_ILLEGAL_VALUE, TIMEOUT, RETRIES
+from ..failover import FailoverClient
+from ..rtu_bus import RTUBusManager, RTUBusClient, BusPriority, bus_priority
 
 _LOGGER = logging.getLogger(__name__)
 
+# Largest read allowed by the Modbus specification
+MAX_REGISTERS_PER_READ = 125
+
+# Largest writes allowed by the Modbus specification (FC16 and FC15)
+MAX_REGISTERS_PER_WRITE = 123
+MAX_COILS_PER_WRITE = 1968
+
 class ModbusDevice():
     # Default properties
     manufacturer = None
@@ -24,12 +36,21 @@ class ModbusDevice():
     # Settings
     byte_order = ByteOrder.MSB
     word_order = WordOrder.NORMAL
+    response_delay = None           # Seconds, set by drivers that can read the response delay of the device
+
+    # Model detection, see detect.py
+    signature: ModbusSignature | None = None    # Registers identifying the model, for devices without FC43
 
     def __init__(self, connection_params: ConnectionParams, rtu_bus: RTUBusManager):
+        # Clients don't retry on their own, _transaction retries per transaction class
         if isinstance(connection_params, TCPConnectionParams):
-            self._client = AsyncModbusTcpClient(host=connection_params.ip, port=connection_params.port)
+            client_factory = lambda host, port: AsyncModbusTcpClient(host=host, port=port, retries=0)
+            self._client = self._create_ip_client(connection_params.endpoints, client_factory)
+        elif isinstance(connection_params, UDPConnectionParams):
+            client_factory = lambda host, port: AsyncModbusUdpClient(host=host, port=port, timeout=connection_params.timeout, retries=0)
+            self._client = self._create_ip_client(connection_params.endpoints, client_factory)
         elif isinstance(connection_params, RTUConnectionParams):
-            self._client = RTUBusClient(rtu_bus)
+            self._client = RTUBusClient(rtu_bus, connection_params.baud_rate)
         else:
             raise ValueError("Unsupported connection parameters")
         self._slave_id = connection_params.slave_id
@@ -40,6 +61,36 @@ class ModbusDevice():
         _LOGGER.debug("Loaded datapoints for %s %s", self.manufacturer, self.model)
 
         self.firstRead = True
+        self._setupDone = False     # onAfterFirstRead has run, after the first read or from the cache
+
+        # Largest read accepted by this endpoint, probed on first connect unless already known
+        self.max_registers_per_read = MAX_REGISTERS_PER_READ
+        self.max_registers_probed = False
+        # (gateway, count, exact) of a probe, to be persisted. Not exact if every size tried was accepted.
+        self.probe_result: tuple[tuple[str, int] | None, int, bool] | None = None
+        self._read_plans: dict[ModbusGroup, list[ModbusReadBlock]] = {}
+
+        # Failed transactions by exception code, and retries, for diagnostics
+        self.error_counters: Counter[str] = Counter()
+        self._deadline: float | None = None
+
+        # Event loop time of the last read of each group with its own interval
+        self._group_last_read: dict[ModbusGroup, float] = {}
+
+        # Outcome of the latest read of each block, by (group, first register), and the block of each datapoint
+        self.block_status: dict[tuple[ModbusGroup, int], ModbusBlockStatus] = {}
+        self._datapoint_block: dict[tuple[ModbusGroup, str], tuple[ModbusGroup, int]] = {}
+
+        # POLL_ONCE groups holding values from a cache, not read yet
+        self._cached_groups: set[ModbusGroup] = set()
+
+    @staticmethod
+    def _create_ip_client(endpoints, client_factory):
+        # Redundant gateways are handled by a proxy that fails over between them
+        if len(endpoints) > 1:
+            return FailoverClient(endpoints, client_factory)
+        host, port = endpoints[0]
+        return client_factory(host, port)
 
     def close(self):
         """Close the underlying client safely."""
@@ -72,6 +123,13 @@ class ModbusDevice():
     def loadDatapoints(self):
         pass
 
+    @classmethod
+    def matchIdentification(cls, info: dict[int, str]) -> bool:
+        """Whether a Read Device Identification (FC43) response comes from this model. Override if the device reports other names."""
+        vendor = info.get(0, "").lower()
+        product = " ".join(info.get(code, "") for code in (1, 4, 5)).lower()
+        return bool(cls.manufacturer and cls.model) and cls.manufacturer.lower() in vendor and cls.model.lower() in product
+
     """ ******************************************************* """
     """ ************* FUNCTIONS CALLED ON EVENTS ************** """
     """ ******************************************************* """
@@ -85,68 +143,404 @@ class ModbusDevice():
     """ ******************************************************* """
     """ *********** EXTERNAL CALL TO READ ALL DATA ************ """
     """ ******************************************************* """
-    async def readData(self):
+    async def readData(self, deadline: float | None = None):
+        """
+        Read the groups that are due, continuing past groups and blocks that fail.
+
+        The deadline (event loop time) is a budget for the whole cycle: retries are only
+        made, and blocks only started, while there is time left. Raises if nothing could
+        be read, a partial read leaves the failed blocks to block_status. The first read
+        is only done when every POLL_ONCE group is read, as drivers set up from them.
+        """
+        self._deadline = deadline
+
         if self.firstRead:      
             await self._client.connect() 
+            if not self.max_registers_probed:
+                with bus_priority(BusPriority.BACKGROUND):
+                    await self.probeMaxRegisters()
 
         self.onBeforeRead()
 
+        read, error = 0, None
+        pending = self._staticGroupsPending()
         try:
-            for group, _ in self.Datapoints.items():
-                if group.poll_mode == ModbusPollMode.POLL_ON:
-                    await self.readGroup(group)
-                elif group.poll_mode == ModbusPollMode.POLL_ONCE and self.firstRead:
-                    await self.readGroup(group)
-        except Exception as err:
-            raise
+            for group in self.Datapoints:
+                try:
+                    if group.poll_mode == ModbusPollMode.POLL_ON:
+                        if self._groupIsDue(group):
+                            read += await self.readGroup(group)
+                    elif group in pending:
+                        # Also retried later if it failed
+                        with bus_priority(BusPriority.BACKGROUND):
+                            read += await self.readGroup(group)
+                except Exception as exc:
+                    error = exc
+        finally:
+            self._deadline = None
+
+        if read == 0 and error is not None:
+            raise error
+
+        if self.firstRead and not self._setupDone and self._staticGroupsPending():
+            raise ModbusException(f"Device info of {self.manufacturer} {self.model} not read yet") from error
 
         if self.firstRead:   
             self.firstRead = False
-            self.onAfterFirstRead()
+            if not self._setupDone:
+                self._afterFirstRead()
 
         self.onAfterRead()
 
+    def _afterFirstRead(self):
+        self._setupDone = True
+        self.onAfterFirstRead()
+        self._read_plans.clear()    # Drivers may add datapoints in onAfterFirstRead
+
+        # Lets a shared RTU bus compute a tight timeout for this slave
+        if self.response_delay is not None and isinstance(self._client, RTUBusClient):
+            self._client.set_response_delay(self._slave_id, self.response_delay)
+
+    def _groupIsDue(self, group: ModbusGroup) -> bool:
+        """Groups with their own interval are skipped until it has passed."""
+        if group.interval is None:
+            return True
+
+        now = asyncio.get_running_loop().time()
+        last = self._group_last_read.get(group)
+        if last is not None and now - last < group.interval * 0.9:   # Some slack for timer jitter
+            return False
+        self._group_last_read[group] = now
+        return True
+
     """ ******************************************************* """
-    """ ******************** READ GROUP *********************** """
+    """ ********** EXTERNAL CALL TO READ SOME GROUPS ********** """
     """ ******************************************************* """
-    async def readGroup(self, group: ModbusGroup):
-        """Read Modbus group registers and update data points."""
-        MAX_REGISTERS_PER_READ = 125
+    async def readGroups(self, groups: list[ModbusGroup], deadline: float | None = None):
+        """Read the given groups, used when a scheduler decides what to read. Failures are handled as in readData."""
+        self._deadline = deadline
+        self.onBeforeRead()
 
-        addresses = [
-            (dp.address, dp.register_count)
-            for dp in self.Datapoints[group].values()
-        ]
-        start_addr = min(addr for addr, _ in addresses)
-        end_addr = max(addr + register_count for addr, register_count in addresses)
-        n_reg = end_addr - start_addr
-
-        if n_reg > MAX_REGISTERS_PER_READ:
-            raise ValueError(
-                f"Too many registers to read at once ({n_reg} requested, max {MAX_REGISTERS_PER_READ}) "
-                f"for group {group}. Consider splitting the group."
-        )
+        read, error = 0, None
+        try:
+            for group in groups:
+                try:
+                    read += await self.readGroup(group)
+                except Exception as exc:
+                    error = exc
+        finally:
+            self._deadline = None
 
-        method = self._get_read_method(group.mode)    
-        response = await method(address=start_addr, count=n_reg, device_id=self._slave_id)
+        if read == 0 and error is not None:
+            raise error
+        self.onAfterRead()
 
-        # Handle Modbus errors
-        if response.isError():
-            raise ModbusException(f"Error reading group {group}: {response}")
+    """ ******************************************************* """
+    """ ******************** CACHED VALUES ******************** """
+    """ ******************************************************* """
+    def staticValues(self) -> dict[str, dict]:
+        """Values of the POLL_ONCE groups, by group position, for caching between restarts. Groups not read yet are left out."""
+        values = {}
+        for index, (group, datapoints) in enumerate(self.Datapoints.items()):
+            if group.poll_mode == ModbusPollMode.POLL_ONCE and self.groupHasValues(group):
+                values[str(index)] = {key: dp.value for key, dp in datapoints.items()}
+        return values
+
+    def loadStaticValues(self, values: dict[str, dict]):
+        """Use cached values of POLL_ONCE groups, so the first read skips them. Groups that changed in the driver are read as usual."""
+        groups = list(self.Datapoints)
+        for index, group_values in values.items():
+            index = int(index)
+            if index >= len(groups) or groups[index].poll_mode != ModbusPollMode.POLL_ONCE:
+                continue
+            group = groups[index]
+            datapoints = self.Datapoints[group]
+            if set(group_values) != set(datapoints):
+                continue
+            for key, value in group_values.items():
+                datapoints[key].value = value
+            self._cached_groups.add(group)
+
+    def setupFromCache(self, values: dict[str, dict]) -> bool:
+        """
+        Finish the setup from cached values instead of the first read, so entities can be
+        created before the device answers. Needs every POLL_ONCE group in the cache, as
+        drivers set up from them. The polled values are shown until they are read.
+        """
+        once = [group for group in self.Datapoints if group.poll_mode == ModbusPollMode.POLL_ONCE and not group.optional]
+        if not all(group in self._cached_groups for group in once):
+            return False
+
+        self._afterFirstRead()
+
+        # After onAfterFirstRead, as drivers may add polled groups
+        groups = list(self.Datapoints)
+        for index, group_values in values.items():
+            index = int(index)
+            if index >= len(groups) or groups[index].poll_mode != ModbusPollMode.POLL_ON:
+                continue
+            datapoints = self.Datapoints[groups[index]]
+            for key, value in group_values.items():
+                if key in datapoints:
+                    datapoints[key].value = value
+        return True
+
+    def polledValues(self) -> dict[str, dict]:
+        """Values of the POLL_ON groups, by group position, for setupFromCache."""
+        return {
+            str(index): {key: dp.value for key, dp in datapoints.items()}
+            for index, (group, datapoints) in enumerate(self.Datapoints.items())
+            if group.poll_mode == ModbusPollMode.POLL_ON
+        }
 
-        data = response.bits if group.mode in (ModbusMode.COILS, ModbusMode.DISCRETE_INPUTS) else response.registers
-        _LOGGER.debug("Read data from address: %s - %s", start_addr, data)
+    async def revalidateStaticValues(self) -> bool:
+        """Read the groups loaded from the cache again. Returns whether any value differs from the cache."""
+        changed = False
+        for group in list(self._cached_groups):
+            cached = {key: dp.value for key, dp in self.Datapoints[group].items()}
+            await self.readGroup(group)
+            self._cached_groups.discard(group)
+            changed |= cached != {key: dp.value for key, dp in self.Datapoints[group].items()}
+        return changed
+
+    """ ******************************************************* """
+    """ ******************** READ PLANNER ********************* """
+    """ ******************************************************* """
+    def setMaxRegistersPerRead(self, count: int):
+        """Set the largest read accepted by the endpoint, e.g. from a previous probe."""
+        self.max_registers_per_read = max(1, min(count, MAX_REGISTERS_PER_READ))
+        self.max_registers_probed = True
+        self._read_plans.clear()
+
+    def setAcceptedRegistersPerRead(self, count: int):
+        """Reads up to count registers are known to work, e.g. from a probe that found no limit. The probe is skipped if that covers all reads."""
+        probe = self._probeRange()
+        if probe is None or probe[2] <= count:
+            self.max_registers_probed = True
+
+    def _probeRange(self) -> tuple[ModbusGroup, int, int] | None:
+        """Polled group with the largest span of registers, its first address and the span."""
+        groups = [
+            group for group, datapoints in self.Datapoints.items()
+            if datapoints and group.poll_mode in (ModbusPollMode.POLL_ON, ModbusPollMode.POLL_ONCE)
+            and group.mode in (ModbusMode.HOLDING, ModbusMode.INPUT)
+        ]
+        if not groups:
+            return None
+
+        def span(group):
+            dps = self.Datapoints[group].values()
+            return max(dp.address + dp.register_count for dp in dps) - min(dp.address for dp in dps)
+
+        group = max(groups, key=span)
+        return group, min(dp.address for dp in self.Datapoints[group].values()), span(group)
+
+    def planGroup(self, group: ModbusGroup) -> list[ModbusReadBlock]:
+        """Split a group into as few reads as possible within max_registers_per_read."""
+        plan = self._read_plans.get(group)
+        if plan is not None:
+            return plan
+
+        plan = []
+        datapoints = sorted(self.Datapoints[group].items(), key=lambda item: item[1].address)
+        for name, dp in datapoints:
+            if dp.register_count > self.max_registers_per_read:
+                raise ValueError(
+                    f"Datapoint {name} in group {group} needs {dp.register_count} registers, "
+                    f"but the endpoint only accepts {self.max_registers_per_read} per read"
+                )
+
+            block = plan[-1] if plan else None
+            if block is not None and dp.address + dp.register_count - block.start <= self.max_registers_per_read:
+                block.count = max(block.count, dp.address + dp.register_count - block.start)
+                block.keys.append(name)
+            else:
+                plan.append(ModbusReadBlock(start=dp.address, count=dp.register_count, keys=[name]))
+
+        self._read_plans[group] = plan
+        return plan
+
+    async def probeMaxRegisters(self):
+        """
+        Find the largest read the endpoint accepts.
+
+        Some gateways reject requests well below the 125 registers allowed by the
+        specification. Reads are made inside the span of the largest polled group,
+        so every address probed is one the normal poll reads anyway. A binary search
+        between a single register and the full span finds the limit.
+
+        Only an illegal data value (03) counts as a rejected size. Any other error,
+        like a timeout or a busy slave, makes the probe inconclusive, and nothing is
+        set. With redundant gateways the result is for the gateway that was probed.
+
+        If even the full span is accepted, the real limit is not known, only that reads
+        of that size work. That is reported as a lower bound, not applied as a limit.
+        """
+        probe = self._probeRange()
+        if probe is None:
+            return
+
+        group, start, span = probe
+        hi = min(span, MAX_REGISTERS_PER_READ)
+        method = self._get_read_method(group.mode)
+
+        async def accepted(count: int) -> bool | None:
+            """Whether a read of count registers is accepted, None if the answer says nothing about the size."""
+            try:
+                response = await self._transaction(TransactionClass.READ, method, address=start, count=count, device_id=self._slave_id)
+            except (ModbusException, ConnectionError, asyncio.TimeoutError):
+                return None
+            if not response.isError():
+                return True
+            return False if getattr(response, "exception_code", None) == EXCEPTION_ILLEGAL_VALUE else None
+
+        gateway = self._client.active_endpoint if isinstance(self._client, FailoverClient) else None
+
+        result = await accepted(hi)
+        if result is None or (not result and await accepted(1) is not True):
+            _LOGGER.debug("Max registers probe of %s %s inconclusive, not applying a limit", self.manufacturer, self.model)
+            return
+
+        if result:
+            # The largest read we need works, which is all that was tested. That is only the
+            # real limit if it is the largest read the specification allows.
+            count, exact = hi, hi == MAX_REGISTERS_PER_READ
+        else:
+            lo = 1
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                result = await accepted(mid)
+                if result is None:
+                    _LOGGER.debug("Max registers probe of %s %s inconclusive, not applying a limit", self.manufacturer, self.model)
+                    return
+                if result:
+                    lo = mid
+                else:
+                    hi = mid
+            _LOGGER.info("Endpoint for %s %s accepts at most %d registers per read", self.manufacturer, self.model, lo)
+            count, exact = lo, True
+
+        if gateway is not None and self._client.active_endpoint is not gateway:
+            return      # Failed over during the probe, so the reads went to different gateways
+
+        if exact:
+            self.setMaxRegistersPerRead(count)
+        else:
+            self.max_registers_probed = True
+        self.probe_result = ((gateway.host, gateway.port) if gateway is not None else None, count, exact)
+
+    """ ******************************************************* """
+    """ ******************** READ GROUP *********************** """
+    """ ******************************************************* """
+    async def readGroup(self, group: ModbusGroup) -> int:
+        """
+        Read Modbus group registers and update data points.
+
+        A failing block does not stop the others. Blocks left when the cycle budget is
+        spent are skipped until the next cycle. Returns the number of blocks read, and
+        raises if blocks were tried but none could be read.
+        """
+        read, error = 0, None
+        loop = asyncio.get_running_loop()
+        for block in self.planGroup(group):
+            remaining = None if self._deadline is None else self._deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                _LOGGER.debug("Cycle budget spent, skipping group %s from %s", group, block.start)
+                break
+            try:
+                await asyncio.wait_for(self.readBlock(group, block), remaining)
+                read += 1
+            except asyncio.TimeoutError as exc:
+                # Also raised when the budget runs out during the block, which readBlock can't see
+                self._setBlockStatus(group, block, exc)
+                error = exc
+            except Exception as exc:
+                error = exc
+
+        if read == 0 and error is not None:
+            raise error
+        return read
 
-        # Process the registers and update data points
-        for name, dp in self.Datapoints[group].items():
-            offset = dp.address - start_addr
-            registers = data[offset:offset + dp.register_count]
+    async def readBlock(self, group: ModbusGroup, block: ModbusReadBlock):
+        """Read one planned block and update its data points."""
+        try:
+            method = self._get_read_method(group.mode)    
+            response = await self._transaction(TransactionClass.READ, method, address=block.start, count=block.count, device_id=self._slave_id)
+
+            # Handle Modbus errors
+            if response.isError():
+                raise ModbusException(f"Error reading group {group} at {block.start} ({block.count} registers): {response}")
+
+            data = response.bits if group.mode in (ModbusMode.COILS, ModbusMode.DISCRETE_INPUTS) else response.registers
+            _LOGGER.debug("Read data from address: %s - %s", block.start, data)
+
+            # Process the registers and update data points
+            for name in block.keys:
+                dp = self.Datapoints[group][name]
+                offset = dp.address - block.start
+                registers = data[offset:offset + dp.register_count]
+
+                try:
+                    dp.from_modbus(registers, self.byte_order, self.word_order)
+                except Exception as exc:
+                    _LOGGER.warning("Failed to decode datapoint %s in group %s (addr=%s len=%s raw=%s)", name, group, dp.address, dp.register_count, registers, exc_info=exc)
+                    raise
+        except Exception as exc:
+            self._setBlockStatus(group, block, exc)
+            raise
+        self._setBlockStatus(group, block, None)
+
+    def _setBlockStatus(self, group: ModbusGroup, block: ModbusReadBlock, error: Exception | None):
+        status = self.block_status.setdefault((group, block.start), ModbusBlockStatus())
+        status.keys = list(block.keys)
+        status.last_attempt = time.time()
+        for key in block.keys:
+            self._datapoint_block[(group, key)] = (group, block.start)
+
+        # Logged when the state changes, not on every poll
+        if error is None:
+            if status.error is not None:
+                _LOGGER.info("Block at %s of %s %s can be read again", block.start, self.manufacturer, self.model)
+            status.last_success = status.last_attempt
+            status.error = None
+        else:
+            if status.error is None:
+                _LOGGER.warning("Failed to read block at %s of %s %s: %s", block.start, self.manufacturer, self.model, error)
+            status.error = str(error) or type(error).__name__
+
+    def _staticGroupsPending(self) -> list[ModbusGroup]:
+        """POLL_ONCE groups with blocks that have not been read, and no cached values. Optional groups are only tried once."""
+        return [
+            group for group in self.Datapoints
+            if group.poll_mode == ModbusPollMode.POLL_ONCE and group not in self._cached_groups and not self._groupWasRead(group)
+            and not (group.optional and any(status_group is group for status_group, _ in self.block_status))
+        ]
 
+    async def readStaticGroups(self):
+        """Read the POLL_ONCE groups not read yet, for schedulers that only read POLL_ON groups."""
+        for group in self._staticGroupsPending():
             try:
-                dp.from_modbus(registers, self.byte_order, self.word_order)
+                with bus_priority(BusPriority.BACKGROUND):
+                    await self.readGroup(group)
             except Exception as exc:
-                _LOGGER.warning("Failed to decode datapoint %s in group %s (addr=%s len=%s raw=%s)", name, group, dp.address, dp.register_count, registers, exc_info=exc)
-                raise
+                _LOGGER.debug("Failed to read group %s of %s %s: %s", group, self.manufacturer, self.model, exc)
+
+    def groupHasValues(self, group: ModbusGroup) -> bool:
+        """Whether the values of a POLL_ONCE group are known, read from the device or the cache. For optional groups."""
+        return group in self._cached_groups or self._groupWasRead(group)
+
+    def _groupWasRead(self, group: ModbusGroup) -> bool:
+        """Whether every block of the group has been read successfully at least once."""
+        for block in self.planGroup(group):
+            status = self.block_status.get((group, block.start))
+            if status is None or status.last_success is None:
+                return False
+        return True
+
+    def datapointAvailable(self, group: ModbusGroup, key: str) -> bool:
+        """Whether the latest read of the block holding a data point succeeded. Data points not read in blocks are always available."""
+        block = self._datapoint_block.get((group, key))
+        return block is None or self.block_status[block].error is None
 
     """ ******************************************************* """
     """ **************** READ SINGLE VALUE ******************** """
@@ -160,8 +554,10 @@ class ModbusDevice():
         dp = self.Datapoints[group][key]
         register_count = dp.register_count
 
+        # Single values are read on user request, so they go ahead of routine polling on a shared bus
         method = self._get_read_method(group.mode) 
-        response = await method(address=dp.address, count=register_count, device_id=self._slave_id)
+        with bus_priority(BusPriority.READBACK):
+            response = await self._transaction(TransactionClass.READ, method, address=dp.address, count=register_count, device_id=self._slave_id)
 
         # Handle Modbus errors
         if response.isError():
@@ -179,12 +575,50 @@ class ModbusDevice():
 
         return dp.value
 
+    """ ******************************************************* """
+    """ ************* READ DEVICE IDENTIFICATION ************** """
+    """ ******************************************************* """
+    async def readDeviceIdentification(self) -> dict[int, str] | None:
+        """
+        Basic device identification objects (vendor, product code, revision), None if not supported.
+        Made once and not retried, as devices without FC43 often don't answer it at all.
+        """
+        response = await self._client.read_device_information(device_id=self._slave_id)
+        if response.isError():
+            return None
+        return {code: value.decode("ascii", errors="ignore").strip() for code, value in response.information.items() if isinstance(value, bytes)}
+
+    async def readRegisters(self, mode: ModbusMode, address: int, count: int) -> list[int] | None:
+        """Raw read of a register range, None if the device refuses it."""
+        method = self._get_read_method(mode)
+        response = await self._transaction(TransactionClass.READ, method, address=address, count=count, device_id=self._slave_id)
+        if response.isError():
+            return None
+        data = response.bits if mode in (ModbusMode.COILS, ModbusMode.DISCRETE_INPUTS) else response.registers
+        return list(data[:count])
+
     """ ******************************************************* """
     """ **************** WRITE SINGLE VALUE ******************* """
     """ ******************************************************* """
     async def writeValue(self, group: ModbusGroup, key: str, value: float):
         _LOGGER.debug("Writing value: Group: %s, Key: %s, Value: %s", group, key, value)
 
+        name, kwargs = self.writeRequest(group, key, value)
+        response = await self._transaction(
+            TransactionClass.WRITE, getattr(self._client, name),
+            device_id=self._slave_id,
+            **kwargs,
+        )
+
+        if response.isError():
+            raise ModbusException(f"Failed to write value for key '{key}': {response}")
+
+        # Update the cached value
+        self.Datapoints[group][key].value = value
+        _LOGGER.debug("Successfully wrote value for key '%s': %s", key, value)
+
+    def writeRequest(self, group: ModbusGroup, key: str, value: float) -> tuple[str, dict]:
+        """Client method name and arguments, except the slave ID, that write a value."""
         if key not in self.Datapoints[group]:
             raise KeyError(f"Key '{key}' not found in group '{group}'")
 
@@ -196,35 +630,152 @@ class ModbusDevice():
         # Get value as modbus registers
         registers = datapoint.to_modbus(value, self.byte_order, self.word_order)
 
-        # Write the registers
-        address = datapoint.address
-
         if group.mode == ModbusMode.COILS:
-            method = self._client.write_coil if register_count == 1 else self._client.write_coils
+            name = "write_coil" if register_count == 1 else "write_coils"
         elif group.mode == ModbusMode.HOLDING:
-            method = self._client.write_register if register_count == 1 else self._client.write_registers
+            name = "write_register" if register_count == 1 else "write_registers"
         else:
             raise ModbusException(f"Write Value: Unsupported Modbus mode {group.mode!r} for group {group!r}")
 
         if register_count == 1:
-            response = await method(
-                address=address,
-                value=registers[0],
-                device_id=self._slave_id,
-            )
+            return name, {"address": datapoint.address, "value": registers[0]}
+        return name, {"address": datapoint.address, "values": registers}
+
+    """ ******************************************************* """
+    """ *************** WRITE SEVERAL VALUES ****************** """
+    """ ******************************************************* """
+    async def writeValues(self, values: list[tuple[ModbusGroup, str, float]], verify: bool = False) -> dict[tuple[ModbusGroup, str], Exception | None]:
+        """
+        Write several values with as few transactions as possible.
+
+        Datapoints on adjacent addresses are merged into one multiple-register (FC16)
+        or multiple-coil (FC15) write, also across groups of the same mode. Returns
+        the result per (group, key): None on success, otherwise the error.
+
+        With verify, the written registers are read back and the datapoints get the
+        value the device actually holds, which may be clamped.
+        """
+        results: dict[tuple[ModbusGroup, str], Exception | None] = {}
+
+        # Encode every value, ordered by address within each mode
+        encoded = {ModbusMode.HOLDING: [], ModbusMode.COILS: []}
+        for group, key, value in values:
+            try:
+                if group.mode not in encoded:
+                    raise ModbusException(f"Write Value: Unsupported Modbus mode {group.mode!r} for group {group!r}")
+                datapoint = self.Datapoints[group][key]
+                registers = datapoint.to_modbus(value, self.byte_order, self.word_order)
+            except Exception as exc:
+                results[(group, key)] = exc
+                continue
+            encoded[group.mode].append((datapoint.address, registers, group, key, value))
+
+        for mode, items in encoded.items():
+            for run in self._planWrites(mode, items):
+                await self._writeRun(mode, run, results, verify)
+
+        return results
+
+    def _planWrites(self, mode: ModbusMode, items: list) -> list[list]:
+        """Split writes into runs of contiguous addresses, each written in one transaction."""
+        limit = MAX_COILS_PER_WRITE if mode == ModbusMode.COILS else MAX_REGISTERS_PER_WRITE
+        runs = []
+        for item in sorted(items, key=lambda item: item[0]):
+            address, registers = item[0], item[1]
+            run = runs[-1] if runs else None
+            if run is not None:
+                run_start = run[0][0]
+                run_end = run[-1][0] + len(run[-1][1])
+                if address == run_end and address + len(registers) - run_start <= limit:
+                    run.append(item)
+                    continue
+            runs.append([item])
+        return runs
+
+    async def _writeRun(self, mode: ModbusMode, run: list, results: dict, verify: bool = False) -> None:
+        start = run[0][0]
+        registers = [register for item in run for register in item[1]]
+
+        if len(registers) == 1:
+            name, kwargs = ("write_coil" if mode == ModbusMode.COILS else "write_register"), {"address": start, "value": registers[0]}
         else:
-            response = await method(
-                address=address,
-                values=registers,
+            name, kwargs = ("write_coils" if mode == ModbusMode.COILS else "write_registers"), {"address": start, "values": registers}
+
+        error = None
+        try:
+            response = await self._transaction(
+                TransactionClass.WRITE, getattr(self._client, name),
                 device_id=self._slave_id,
+                **kwargs,
             )
+            if response.isError():
+                error = ModbusException(f"Failed to write {len(registers)} registers at {start}: {response}")
+        except Exception as exc:
+            error = exc
 
-        if response.isError():
-            raise ModbusException(f"Failed to write value for key '{key}': {response}")
+        for _, _, group, key, value in run:
+            results[(group, key)] = error
+            if error is None:
+                self.Datapoints[group][key].value = value
+        _LOGGER.debug("Wrote %d datapoints at %s in one transaction: %s", len(run), start, error or "ok")
 
-        # Update the cached value
-        datapoint.value = value
-        _LOGGER.debug("Successfully wrote value for key '%s': %s", key, value)
+        if error is not None or not verify:
+            return
+
+        # Take the values from the device with a read of the written range
+        try:
+            data = await self.readRegisters(mode, start, len(registers))
+            if data is None:
+                raise ModbusException(f"Read-back of {len(registers)} registers at {start} refused")
+            for address, encoded, group, key, _ in run:
+                offset = address - start
+                self.Datapoints[group][key].from_modbus(data[offset:offset + len(encoded)], self.byte_order, self.word_order)
+        except Exception as exc:
+            _LOGGER.debug("Could not verify write at %s: %s", start, exc)
+
+    """ ******************************************************* """
+    """ ************** TRANSACTIONS WITH RETRIES ************** """
+    """ ******************************************************* """
+    async def _transaction(self, txn_class: TransactionClass, method, **kwargs):
+        """
+        Perform one Modbus request, retrying according to the policy for its transaction class.
+
+        Returns the last response, which may be an error response, so callers keep
+        their own error handling. A timeout that is not retried is raised.
+        """
+        policy = RETRY_POLICIES[txn_class]
+        attempt = 0
+
+        while True:
+            attempt += 1
+            code = None
+            try:
+                response = await method(**kwargs)
+            except (ModbusIOException, asyncio.TimeoutError) as err:
+                response, error, reason = None, err, TIMEOUT
+            else:
+                if not response.isError():
+                    return response
+                code = getattr(response, "exception_code", None)
+                reason = EXCEPTION_NAMES.get(code, f"exception_{code:02x}" if code is not None else "error")
+
+            self.error_counters[reason] += 1
+
+            retryable = code in policy.retry_codes if response is not None else policy.retry_timeouts
+            delay = policy.backoff * 2 ** (attempt - 1)
+            if not retryable or attempt >= policy.attempts or not self._within_budget(delay):
+                if response is None:
+                    raise error
+                return response
+
+            _LOGGER.debug("Retrying %s after %s (attempt %d, waiting %.2fs)", txn_class.value, reason, attempt, delay)
+            self.error_counters[RETRIES] += 1
+            await asyncio.sleep(delay)
+
+    def _within_budget(self, delay: float) -> bool:
+        if self._deadline is None:
+            return True
+        return asyncio.get_running_loop().time() + delay < self._deadline
 
     """ ******************************************************* """
     """ *********** HELPER FOR PROCESSING REGISTERS *********** """
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from enum import Enum
+
+# Modbus exception codes that say something about whether a retry can help
+EXCEPTION_ILLEGAL_FUNCTION = 0x01
+EXCEPTION_ILLEGAL_ADDRESS = 0x02
+EXCEPTION_ILLEGAL_VALUE = 0x03
+EXCEPTION_DEVICE_FAILURE = 0x04
+EXCEPTION_ACKNOWLEDGE = 0x05
+EXCEPTION_SLAVE_BUSY = 0x06
+EXCEPTION_GATEWAY_PATH_UNAVAILABLE = 0x0A
+EXCEPTION_GATEWAY_TARGET_NO_RESPONSE = 0x0B
+
+# Names used for the error counters
+EXCEPTION_NAMES = {
+    EXCEPTION_ILLEGAL_FUNCTION: "illegal_function",
+    EXCEPTION_ILLEGAL_ADDRESS: "illegal_address",
+    EXCEPTION_ILLEGAL_VALUE: "illegal_value",
+    EXCEPTION_DEVICE_FAILURE: "device_failure",
+    EXCEPTION_ACKNOWLEDGE: "acknowledge",
+    EXCEPTION_SLAVE_BUSY: "slave_busy",
+    EXCEPTION_GATEWAY_PATH_UNAVAILABLE: "gateway_path_unavailable",
+    EXCEPTION_GATEWAY_TARGET_NO_RESPONSE: "gateway_target_no_response",
+}
+TIMEOUT = "timeout"
+RETRIES = "retries"
+
+
+class TransactionClass(str, Enum):
+    READ = "read"           # Idempotent, safe to repeat
+    WRITE = "write"         # Must not be repeated unless the device says it was not executed
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int                           # Total attempts, including the first one
+    backoff: float                          # Delay before the first retry, doubled for each retry
+    retry_codes: frozenset[int]             # Exception codes worth retrying
+    retry_timeouts: bool                    # Whether a missing response is worth retrying
+
+
+RETRY_POLICIES = {
+    # Busy and gateway errors are usually gone after a few hundred ms
+    TransactionClass.READ: RetryPolicy(
+        attempts=3,
+        backoff=0.1,
+        retry_codes=frozenset({EXCEPTION_SLAVE_BUSY, EXCEPTION_GATEWAY_PATH_UNAVAILABLE, EXCEPTION_GATEWAY_TARGET_NO_RESPONSE}),
+        retry_timeouts=True,
+    ),
+    # Only "slave busy" guarantees the write was not executed. After a timeout or a
+    # gateway error we can't tell, so the write is not repeated blindly.
+    TransactionClass.WRITE: RetryPolicy(
+        attempts=3,
+        backoff=0.1,
+        retry_codes=frozenset({EXCEPTION_SLAVE_BUSY}),
+        retry_timeouts=False,
+    ),
+}
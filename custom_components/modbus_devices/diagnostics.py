@@ -0,0 +1,59 @@
+"""Diagnostics support for Modbus Devices."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ModbusCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ModbusCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device = coordinator._modbusDevice
+
+    diagnostics = {
+        "entry": dict(entry.data),
+        "device": {
+            "manufacturer": device.manufacturer,
+            "model": device.model,
+            "sw_version": device.sw_version,
+            "connection": coordinator.connection_params.key,
+            "max_registers_per_read": device.max_registers_per_read,
+        },
+        "errors": dict(device.error_counters),
+        "last_update_success": coordinator.last_update_success,
+        "queued_writes": [
+            {"key": key, "value": value, "expires": expires}
+            for (_, key), (value, expires) in coordinator._offline_writes.items()
+        ],
+    }
+
+    diagnostics["blocks"] = [
+        {
+            "mode": group.mode.name,
+            "start": start,
+            "keys": status.keys,
+            "last_attempt": status.last_attempt,
+            "last_success": status.last_success,
+            "error": status.error,
+        }
+        for (group, start), status in device.block_status.items()
+    ]
+
+    if coordinator.rtu_bus is not None:
+        diagnostics["schedule"] = coordinator.rtu_bus.scheduler.stats(coordinator)
+        diagnostics["bus"] = {
+            "port": coordinator.rtu_bus.port,
+            "serial_config": coordinator.rtu_bus.serial_config,
+            "reconfigure_count": coordinator.rtu_bus.reconfigure_count,
+            "reconfigure_time": coordinator.rtu_bus.reconfigure_time,
+            "metrics": coordinator.rtu_bus.metrics.snapshot(),
+            "total_transactions": coordinator.rtu_bus.metrics.total_transactions,
+            "total_timeouts": coordinator.rtu_bus.metrics.total_timeouts,
+        }
+
+    return diagnostics
@@ -35,11 +35,29 @@ class ModbusBaseEntity(CoordinatorEntity):
     def _loadEntitySettings(self):
         pass
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.coordinator.register_entity(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.coordinator.unregister_entity(self)
+        await super().async_will_remove_from_hass()
+
+    @property
+    def available(self) -> bool:
+        """Unavailable when the device can't be read, or only the block holding this datapoint."""
+        return super().available and self.coordinator.is_available(self._group, self._key)
+
     @property
     def extra_state_attributes(self):
         """Return entity-specific state attributes."""
         attrs = self.coordinator.get_attrs(self._group, self._key)
-        return attrs if attrs is not None else {}
+        attrs = dict(attrs) if attrs is not None else {}
+
+        # Set while a written value is shown but not yet confirmed by the device
+        if self.coordinator.is_pending(self._group, self._key):
+            attrs["pending"] = True
+        return attrs
 
     def toggle_entity_visibility(self, hass, visible: bool):
         """Hide or show this entity on the device page at runtime."""
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
+from pymodbus.exceptions import ModbusException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Gateway exception codes meaning "this gateway could not reach the slave".
+# Another gateway on the same segment may still be able to.
+GATEWAY_PATH_UNAVAILABLE = 0x0A
+GATEWAY_TARGET_NO_RESPONSE = 0x0B
+
+
+class Endpoint:
+    """Health and latency bookkeeping for one gateway."""
+
+    LATENCY_SMOOTHING = 0.3             # Weight of the newest sample in the moving average
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.client = None
+        self.latency: float | None = None   # Smoothed round trip in seconds
+        self.failures = 0                   # Consecutive failures
+        self.down_until = 0.0               # Monotonic time before which the endpoint is skipped
+
+    def __str__(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    def record_success(self, elapsed: float) -> None:
+        self.failures = 0
+        self.down_until = 0.0
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += self.LATENCY_SMOOTHING * (elapsed - self.latency)
+
+    def record_failure(self, backoff: float) -> None:
+        self.failures += 1
+        self.down_until = time.monotonic() + min(backoff * 2 ** (self.failures - 1), 300)
+
+
+class FailoverClient:
+    """
+    Proxy that looks like AsyncModbusTcpClient but spreads calls over
+    redundant gateways on the same bus.
+
+    Calls go to the active endpoint. If it fails, a read is retried on the next
+    healthy endpoint, so polling switches within one cycle. A write is only sent
+    to another endpoint if it could not be sent at all, as after a timeout the
+    first gateway may already have executed it. The active
+    endpoint is sticky and is only replaced by a healthy endpoint that is
+    clearly faster, to avoid flapping between gateways.
+    """
+
+    SWITCH_MARGIN = 0.8         # A standby must be at least 20% faster to take over
+    PROBE_EVERY = 50            # Every n-th read is sent to a standby to measure its latency
+    FAILURE_BACKOFF = 10.0      # Seconds an endpoint is skipped after its first failure
+
+    def __init__(self, endpoints: list[tuple[str, int]], client_factory: Callable[[str, int], Any]) -> None:
+        self._endpoints = [Endpoint(host, port) for host, port in endpoints]
+        self._client_factory = client_factory
+        self._active = self._endpoints[0]
+        self._reads = 0
+
+    # ------------------------------
+    # Explicit lifecycle methods
+    # ------------------------------
+
+    async def connect(self) -> None:
+        """Connect to the first endpoint that accepts a connection."""
+        for endpoint in self._candidates():
+            try:
+                await self._ensure_connected(endpoint)
+                self._active = endpoint
+                return
+            except ConnectionError as err:
+                self._mark_failed(endpoint, err)
+
+    def close(self) -> None:
+        for endpoint in self._endpoints:
+            if endpoint.client is not None:
+                endpoint.client.close()
+                endpoint.client = None
+
+    @property
+    def connected(self) -> bool:
+        return self._active.client is not None and self._active.client.connected
+
+    @property
+    def endpoints(self) -> list[Endpoint]:
+        return self._endpoints
+
+    @property
+    def active_endpoint(self) -> Endpoint:
+        return self._active
+
+    # ------------------------------
+    # Endpoint selection
+    # ------------------------------
+
+    def _candidates(self) -> list[Endpoint]:
+        """Endpoints in the order they should be tried."""
+        healthy = [ep for ep in self._endpoints if ep.healthy]
+        down = sorted((ep for ep in self._endpoints if not ep.healthy), key=lambda ep: ep.down_until)
+
+        if not healthy:
+            # Everything is down, try the one that has been down the longest first
+            return down
+
+        preferred = self._active if self._active in healthy else healthy[0]
+        for ep in healthy:
+            if ep.latency is not None and preferred.latency is not None and ep.latency < preferred.latency * self.SWITCH_MARGIN:
+                preferred = ep
+
+        return [preferred] + [ep for ep in healthy if ep is not preferred] + down
+
+    def _probe_target(self) -> Endpoint | None:
+        """Standby endpoint whose latency should be refreshed, if it is time for it."""
+        self._reads += 1
+        if len(self._endpoints) < 2 or self._reads % self.PROBE_EVERY:
+            return None
+        standby = [ep for ep in self._endpoints if ep is not self._active and ep.healthy]
+        return standby[(self._reads // self.PROBE_EVERY) % len(standby)] if standby else None
+
+    async def _ensure_connected(self, endpoint: Endpoint):
+        if endpoint.client is None:
+            endpoint.client = self._client_factory(endpoint.host, endpoint.port)
+        if not endpoint.client.connected:
+            await endpoint.client.connect()
+            if not endpoint.client.connected:
+                raise ConnectionError(f"Failed to connect to {endpoint}")
+        return endpoint.client
+
+    def _mark_failed(self, endpoint: Endpoint, err) -> None:
+        endpoint.record_failure(self.FAILURE_BACKOFF)
+        _LOGGER.warning("Modbus endpoint %s failed (%s), %d consecutive failures", endpoint, err, endpoint.failures)
+        if endpoint.client is not None:
+            endpoint.client.close()
+            endpoint.client = None
+
+    # ------------------------------
+    # Dynamic method proxying
+    # ------------------------------
+
+    async def _call(self, name: str, *args, **kwargs):
+        candidates = self._candidates()
+
+        # Occasionally move a read to a standby endpoint to keep its latency current
+        if name.startswith("read_"):
+            probe = self._probe_target()
+            if probe is not None:
+                candidates.remove(probe)
+                candidates.insert(0, probe)
+
+        # Reads are safe to repeat, writes are not once they may have reached the slave
+        repeatable = name.startswith("read_")
+
+        last_err: Exception | None = None
+        gateway_response = None
+        for endpoint in candidates:
+            try:
+                client = await self._ensure_connected(endpoint)
+            except (ConnectionError, ModbusException, asyncio.TimeoutError) as err:
+                # Nothing was sent, so any call can move on to the next endpoint
+                last_err = err
+                self._mark_failed(endpoint, err)
+                continue
+
+            try:
+                start = time.monotonic()
+                response = await getattr(client, name)(*args, **kwargs)
+                elapsed = time.monotonic() - start
+            except (ConnectionError, ModbusException, asyncio.TimeoutError) as err:
+                self._mark_failed(endpoint, err)
+                if not repeatable:
+                    raise
+                last_err = err
+                continue
+
+            # The gateway answered, but could not reach the slave. The gateway itself is fine,
+            # it may just be the slave that is down, so only try another one.
+            if response.isError() and getattr(response, "exception_code", None) in (GATEWAY_PATH_UNAVAILABLE, GATEWAY_TARGET_NO_RESPONSE):
+                _LOGGER.debug("Gateway %s could not reach the target: %s", endpoint, response)
+                if not repeatable:
+                    return response
+                gateway_response = response
+                continue
+
+            endpoint.record_success(elapsed)
+            if endpoint is not self._active and (not self._active.healthy or self._candidates()[0] is endpoint):
+                _LOGGER.info("Switching Modbus endpoint from %s to %s", self._active, endpoint)
+                self._active = endpoint
+            return response
+
+        if gateway_response is not None:
+            # No gateway reached the slave, which the caller handles like any exception response
+            return gateway_response
+        raise ConnectionError(f"No Modbus endpoint available: {last_err}")
+
+    def __getattr__(self, name: str):
+        """Proxy async Modbus calls to the preferred endpoint."""
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def proxy(*args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+
+        return proxy
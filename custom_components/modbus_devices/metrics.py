@@ -0,0 +1,70 @@
+"""Load metrics of a shared Modbus transport, over a sliding window."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+
+WINDOW = 60.0   # Seconds of history the metrics are computed over
+
+
+@dataclass
+class _Transaction:
+    end: float              # Monotonic time the bus was released
+    busy: float             # Seconds the bus was held
+    lock_wait: float        # Seconds waited for the bus
+    bytes: int              # Bytes on the wire, both directions
+    timeout: bool
+
+
+class BusMetrics:
+    """
+    Busy time, lock wait, throughput and timeouts of one bus.
+
+    Independent of the transport, so it can be used for a serial port as well as
+    for a gateway shared by several devices.
+    """
+
+    def __init__(self, window: float = WINDOW) -> None:
+        self.window = window
+        self._transactions: deque[_Transaction] = deque()
+        self._started = time.monotonic()
+
+        # Totals since start, for diagnostics
+        self.total_transactions = 0
+        self.total_timeouts = 0
+
+    def record(self, busy: float, lock_wait: float, nbytes: int, timeout: bool = False) -> None:
+        """Record one transaction, called when the bus is released."""
+        now = time.monotonic()
+        self._transactions.append(_Transaction(now, busy, lock_wait, nbytes, timeout))
+        self.total_transactions += 1
+        if timeout:
+            self.total_timeouts += 1
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        while self._transactions and self._transactions[0].end < now - self.window:
+            self._transactions.popleft()
+
+    def snapshot(self) -> dict:
+        """Metrics over the window, rates per second."""
+        now = time.monotonic()
+        self._expire(now)
+
+        # Shorter than the window right after start, so rates are not underestimated
+        span = min(self.window, now - self._started) or self.window
+        transactions = self._transactions
+        busy = min(sum(txn.busy for txn in transactions), span)
+        waits = [txn.lock_wait for txn in transactions]
+
+        return {
+            "utilization": 100 * busy / span,
+            "busy_time": busy,
+            "idle_time": span - busy,
+            "lock_wait_avg": sum(waits) / len(waits) if waits else 0.0,
+            "lock_wait_max": max(waits, default=0.0),
+            "transactions_per_second": len(transactions) / span,
+            "bytes_per_second": sum(txn.bytes for txn in transactions) / span,
+            "timeouts": sum(1 for txn in transactions if txn.timeout),
+        }
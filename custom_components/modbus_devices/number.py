@@ -58,6 +58,4 @@ class ModbusNumberEntity(ModbusBaseEntity, NumberEntity):
             await self.coordinator.write_value(self._group, self._key, value)
         except Exception as err:
             _LOGGER.debug("Error writing command: %s %s", self._group, self._key)
-        finally:
-            self.async_schedule_update_ha_state(force_refresh=False)
             
@@ -1,21 +1,208 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Any, Callable
+import threading
+import time
+from contextlib import contextmanager
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable
 
 from pymodbus.client import AsyncModbusSerialClient
+from pymodbus.exceptions import ModbusIOException
+
+from .metrics import BusMetrics
+from .rtu_scheduler import RTUBusScheduler
+from .rtu_timing import char_time, frame_sizes, inter_frame_gap, response_timeout, BROADCAST_TURNAROUND, TIMEOUT_MARGIN
+from .rtu_timing import SCAN_REQUEST_BYTES, SCAN_RESPONSE_BYTES, DEVICE_ID_REQUEST_BYTES, DEVICE_ID_RESPONSE_BYTES
 
 _LOGGER = logging.getLogger(__name__)
 
 
+BROADCAST_ID = 0
+SLAVE_IDS = range(1, 248)       # Valid unicast slave IDs
+
+
+class BusPriority(IntEnum):
+    """Order in which waiting transactions get the bus, lowest first."""
+    WRITE = 0               # Interactive writes
+    READBACK = 1            # Reads following up on a write or a user action
+    POLL = 2                # Routine polling
+    BACKGROUND = 3          # POLL_ONCE groups, probes and scans
+
+
+# Priority for bus transactions made from the current task, if not the default
+_bus_priority: ContextVar[BusPriority | None] = ContextVar("modbus_bus_priority", default=None)
+
+
+@contextmanager
+def bus_priority(priority: BusPriority):
+    """Run the transactions inside the block with the given bus priority."""
+    token = _bus_priority.set(priority)
+    try:
+        yield
+    finally:
+        _bus_priority.reset(token)
+
+
+class _PriorityLock:
+    """Lock that is handed to the waiter with the highest priority, FIFO within one priority."""
+
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    def locked(self) -> bool:
+        return self._locked
+
+    async def acquire(self, priority: BusPriority) -> None:
+        if not self._locked and not self._waiters:
+            self._locked = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The lock may have been handed to us just before we were cancelled
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        # Hand the lock over directly, so no new arrival can sneak in before the next waiter
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._locked = False
+
+
+class _IOThread:
+    """Worker thread running its own asyncio loop, so bus timing does not depend on the HA loop."""
+
+    def __init__(self, name: str) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def run(self, coro: Awaitable) -> Any:
+        """Run a coroutine on the worker loop and wait for it from the calling loop."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def call_soon(self, func, *args) -> None:
+        self._loop.call_soon_threadsafe(func, *args)
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+@dataclass
+class _SlaveTiming:
+    """Response timing of one slave on the bus."""
+    delay: float | None = None          # Learned response delay, seconds
+    hint: float | None = None           # Response delay reported by the device itself
+
+    DELAY_SMOOTHING = 0.2
+
+    def expected_delay(self) -> float | None:
+        """Response delay to allow for, None while nothing is known about the slave."""
+        known = [value for value in (self.delay, self.hint) if value is not None]
+        return max(known) if known else None
+
+    def record_response(self, delay: float) -> None:
+        if self.delay is None:
+            self.delay = delay
+        else:
+            self.delay += self.DELAY_SMOOTHING * (delay - self.delay)
+
+
+class SlaveQuarantinedError(ConnectionError):
+    """Raised instead of a transaction when the slave is quarantined."""
+
+
+@dataclass
+class _SlaveHealth:
+    """
+    Health of one slave on the bus.
+
+    After a few timeouts in a row the slave is quarantined. While quarantined,
+    transactions fail at once without using the bus, except for a single short
+    probe read once the backoff has passed. Time lost on failed transactions is
+    also capped to a share of the bus, so a flapping slave can't starve the rest.
+    """
+    failures: int = 0                   # Consecutive timeouts
+    quarantined_until: float = 0.0      # Monotonic time of the next probe, 0 when not quarantined
+    backoff: float = 0.0
+    failed_time: deque = field(default_factory=deque)   # (monotonic end, seconds) of failed transactions
+
+    QUARANTINE_AFTER = 3                # Consecutive timeouts
+    BACKOFF_MIN = 5.0                   # Seconds before the first probe
+    BACKOFF_MAX = 300.0
+    SHARE_WINDOW = 60.0                 # Seconds of history for the bus time cap
+    MAX_FAILED_SHARE = 0.1              # Share of the window a slave may spend on failed transactions
+
+    @property
+    def quarantined(self) -> bool:
+        return self.quarantined_until > 0
+
+    def probe_due(self, now: float) -> bool:
+        return now >= self.quarantined_until
+
+    def over_budget(self, now: float) -> bool:
+        while self.failed_time and self.failed_time[0][0] < now - self.SHARE_WINDOW:
+            self.failed_time.popleft()
+        return sum(duration for _, duration in self.failed_time) > self.SHARE_WINDOW * self.MAX_FAILED_SHARE
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.quarantined_until = 0.0
+        self.backoff = 0.0
+
+    def record_failure(self, now: float, duration: float) -> bool:
+        """Returns True if the slave went into quarantine."""
+        self.failures += 1
+        self.failed_time.append((now, duration))
+
+        if self.quarantined:
+            self.backoff = min(self.backoff * 2, self.BACKOFF_MAX)
+            self.quarantined_until = now + self.backoff
+            return False
+
+        if self.failures >= self.QUARANTINE_AFTER or self.over_budget(now):
+            self.backoff = self.BACKOFF_MIN
+            self.quarantined_until = now + self.backoff
+            return True
+        return False
+
+
 class RTUBusManager:
     """Owns a single Modbus RTU serial port and serializes all access."""
 
-    def __init__(self, *, hass, port: str, baudrate: int, bytesize: int, parity: str, stopbits: int, timeout: float) -> None:
+    def __init__(self, *, hass, port: str, baudrate: int, bytesize: int, parity: str, stopbits: int, timeout: float, io_thread: bool = False) -> None:
         self.hass = hass
         self.port = port
+        self.io_thread = io_thread
 
+        # Settings the port is currently configured with. Devices with other settings
+        # on the same port make the bus reconfigure the port between transactions.
         self._serial_cfg = {
             "baudrate": baudrate,
             "bytesize": bytesize,
@@ -23,10 +210,32 @@ class RTUBusManager:
             "stopbits": stopbits,
             "timeout": timeout,
         }
+        self.reconfigure_count = 0
+        self.reconfigure_time = 0.0         # Seconds spent switching serial settings
 
-        self._lock = asyncio.Lock()
+        self._lock = _PriorityLock()
+        self._start_lock = asyncio.Lock()       # Opening and closing the port, which is done outside the bus lock
         self._client: AsyncModbusSerialClient | None = None
         self._users: set[str] = set()
+        self._io: _IOThread | None = None
+
+        # Frame timing, computed from the serial settings and learned per slave
+        self._slave_timing: dict[int, _SlaveTiming] = {}
+        self._last_frame_end = 0.0
+
+        # Slaves that stop answering are quarantined so they don't starve the bus
+        self._slave_health: dict[int, _SlaveHealth] = {}
+
+        # Load of the bus, shown as sensors on the bus device
+        self.metrics = BusMetrics()
+        self.metrics_owner: str | None = None      # Config entry whose sensor platform carries the bus sensors
+        self._sensor_platforms: dict[str, Callable[[], None]] = {}
+
+        # Polls all devices on the bus, replacing per-coordinator timers
+        self.scheduler = RTUBusScheduler(self)
+
+        # First polls of devices started in the background take turns, in the order they were set up
+        self.startup_lock = asyncio.Lock()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -36,10 +245,24 @@ class RTUBusManager:
         if self._client is not None:
             return
 
-        _LOGGER.debug("Opening Modbus RTU bus on %s", self.port)
+        async with self._start_lock:
+            if self._client is not None:
+                return      # Opened while waiting
+
+            _LOGGER.debug("Opening Modbus RTU bus on %s", self.port)
 
+            if self.io_thread and self._io is None:
+                # The client must be created on the loop that will run its I/O
+                self._io = _IOThread(name=f"modbus_rtu {self.port}")
+                self._io.start()
+
+            self._client = await self._run_io(self._connect_client())
+
+    async def _connect_client(self) -> AsyncModbusSerialClient:
+        # Retries are made by the devices, per transaction class, never by pymodbus
         client = AsyncModbusSerialClient(
             port=self.port,
+            retries=0,
             **self._serial_cfg,
         )
 
@@ -49,16 +272,32 @@ class RTUBusManager:
             client.close()
             raise ConnectionError(f"Failed to open RTU port {self.port}")
 
-        self._client = client
+        return client
 
     async def async_stop(self) -> None:
-        if self._client is None:
-            return
+        async with self._start_lock:
+            if self._client is None and self._io is None:
+                return
 
-        _LOGGER.debug("Closing Modbus RTU bus on %s", self.port)
+            _LOGGER.debug("Closing Modbus RTU bus on %s", self.port)
 
-        self._client.close()
-        self._client = None
+            client, self._client = self._client, None
+            io, self._io = self._io, None
+
+            if io is None:
+                if client is not None:
+                    client.close()
+                return
+
+            if client is not None:
+                io.call_soon(client.close)
+            await self.hass.async_add_executor_job(io.stop)
+
+    async def _run_io(self, coro: Awaitable) -> Any:
+        """Run a coroutine on the bus I/O loop, which is the HA loop unless a worker thread is used."""
+        if self._io is None:
+            return await coro
+        return await self._io.run(coro)
 
     # ------------------------------------------------------------------
     # Reference tracking
@@ -69,6 +308,7 @@ class RTUBusManager:
 
     async def detach(self, entry_id: str) -> bool:
         self._users.discard(entry_id)
+        self.unregister_sensor_platform(entry_id)
 
         if not self._users:
             await self.async_stop()
@@ -76,28 +316,307 @@ class RTUBusManager:
 
         return False
 
+    def register_sensor_platform(self, entry_id: str, add_bus_sensors: Callable[[], None]) -> None:
+        """
+        Sensor platform of a device on the bus, which can add the bus sensors to it.
+        The first one carries them, the others take over when it is unloaded.
+        """
+        self._sensor_platforms[entry_id] = add_bus_sensors
+        if self.metrics_owner is None:
+            self._add_bus_sensors(entry_id)
+
+    def unregister_sensor_platform(self, entry_id: str) -> None:
+        """Forget the sensor platform of an unloaded device, moving the bus sensors to another one."""
+        self._sensor_platforms.pop(entry_id, None)
+        if self.metrics_owner != entry_id:
+            return
+
+        # The sensors were removed with the platform
+        self.metrics_owner = None
+        if self._sensor_platforms and not self.hass.is_stopping:
+            self._add_bus_sensors(next(iter(self._sensor_platforms)))
+
+    def _add_bus_sensors(self, entry_id: str) -> None:
+        self.metrics_owner = entry_id
+        self._sensor_platforms[entry_id]()
+
     # ------------------------------------------------------------------
-    # Validation
+    # Serial settings
     # ------------------------------------------------------------------
 
-    def matches_serial_config(self, *, baudrate: int, bytesize: int, parity: str, stopbits: int, timeout: float) -> bool:
-        return self._serial_cfg == { 
-            "baudrate": baudrate,
-            "bytesize": bytesize,
-            "parity": parity,
-            "stopbits": stopbits,
-            "timeout": timeout,
-        }
+    @property
+    def serial_config(self) -> dict:
+        return dict(self._serial_cfg)
+
+    def serial_config_for(self, baudrate: int) -> dict:
+        """Serial settings for a device on this port with the given baud rate."""
+        return {**self._serial_cfg, "baudrate": baudrate}
+
+    async def _reconfigure(self, serial_cfg: dict) -> None:
+        """Reopen the port with other settings. Must be called with the bus lock held."""
+        start = time.monotonic()
+        _LOGGER.debug("Reconfiguring %s from %s to %s baud", self.port, self._serial_cfg["baudrate"], serial_cfg["baudrate"])
+
+        # The old client stays in place until the new one is open, so a request arriving
+        # meanwhile waits for the bus lock instead of opening the port a second time
+        client = self._client
+        if client is not None:
+            if self._io is not None:
+                self._io.call_soon(client.close)
+            else:
+                client.close()
+
+        self._serial_cfg = dict(serial_cfg)
+        try:
+            self._client = await self._run_io(self._connect_client())
+        except BaseException:
+            # Opened again with the new settings by the next request
+            self._client = None
+            raise
+
+        elapsed = time.monotonic() - start
+        self.reconfigure_count += 1
+        self.reconfigure_time += elapsed
+        _LOGGER.debug("Reconfigured %s in %.3fs (%d switches, %.1fs total)", self.port, elapsed, self.reconfigure_count, self.reconfigure_time)
+
+    # ------------------------------------------------------------------
+    # Frame timing
+    # ------------------------------------------------------------------
+
+    def set_response_delay(self, slave_id: int, delay: float) -> None:
+        """Response delay reported by the device, used as a lower bound for its timeout."""
+        self._slave_timing.setdefault(slave_id, _SlaveTiming()).hint = delay
+
+    def _request_timeout(self, slave_id: int | None, sizes: tuple[int, int] | None) -> float:
+        """Timeout for one request, never longer than the configured client timeout.
+
+        Until the response delay of the slave is known, the full configured timeout is used,
+        so a slow device is not given up on before it has answered once.
+        """
+        max_timeout = self._serial_cfg["timeout"]
+        if sizes is None or slave_id is None:
+            return max_timeout
+
+        expected_delay = self._slave_timing.setdefault(slave_id, _SlaveTiming()).expected_delay()
+        if expected_delay is None:
+            return max_timeout
+        return min(response_timeout(self._serial_cfg, *sizes, expected_delay), max_timeout)
+
+    async def _timed_call(self, method, args, kwargs, timeout: float) -> tuple[Any, float]:
+        """Perform one transaction on the I/O loop, keeping the silent interval before it."""
+        wait = self._last_frame_end + inter_frame_gap(self._serial_cfg) - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        start = time.monotonic()
+        try:
+            response = await asyncio.wait_for(method(*args, **kwargs), timeout)
+        finally:
+            self._last_frame_end = time.monotonic()
+        return response, self._last_frame_end - start
 
     # ------------------------------------------------------------------
     # Internal execution helper
     # ------------------------------------------------------------------
 
-    async def _execute(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+    async def _execute(self, name: str, *args, priority: BusPriority = BusPriority.POLL, serial_cfg: dict | None = None, **kwargs) -> Any:
+        """Call a method on the shared client, serialized with all other users of the bus."""
         await self.async_start()
 
-        async with self._lock:
-            return await func(*args, **kwargs)
+        slave_id = kwargs.get("device_id")
+        health = self._slave_health.setdefault(slave_id, _SlaveHealth()) if slave_id else None
+
+        # Fail fast without waiting for the bus while the slave is quarantined
+        if health is not None and health.quarantined and not health.probe_due(time.monotonic()):
+            raise SlaveQuarantinedError(f"Slave {slave_id} on {self.port} is quarantined")
+
+        wait_start = time.monotonic()
+        await self._lock.acquire(priority)
+        acquired = time.monotonic()
+        sizes = frame_sizes(name, kwargs) or (0, 0)
+        nbytes, timed_out = 0, False
+        try:
+            client = self._client
+            if client is None:
+                raise ConnectionError("RTU client not available")
+
+            method = getattr(client, name)
+            if not callable(method):
+                return method
+
+            if serial_cfg is not None and serial_cfg != self._serial_cfg:
+                await self._reconfigure(serial_cfg)
+                client = self._client
+
+            if health is not None and health.quarantined:
+                # Another caller may have probed while we waited for the bus
+                if not health.probe_due(time.monotonic()):
+                    raise SlaveQuarantinedError(f"Slave {slave_id} on {self.port} is quarantined")
+                await self._probe(client, slave_id, health)
+
+            start = time.monotonic()
+            try:
+                response = await self._transact(client, name, args, kwargs)
+            except (asyncio.TimeoutError, ModbusIOException):
+                nbytes, timed_out = sizes[0], True
+                if health is not None and health.record_failure(time.monotonic(), time.monotonic() - start):
+                    _LOGGER.warning("Slave %s on %s is not answering, quarantined for %.0fs", slave_id, self.port, health.backoff)
+                raise
+
+            nbytes = sum(sizes)
+            if health is not None:
+                health.record_success()
+            return response
+        finally:
+            self._lock.release()
+            self.metrics.record(time.monotonic() - acquired, acquired - wait_start, nbytes, timed_out)
+
+    async def async_broadcast(self, name: str, *, serial_cfg: dict | None = None, **kwargs) -> None:
+        """
+        Send a write to all slaves on the bus (slave ID 0).
+
+        No slave answers a broadcast, so the request is only sent. The bus is then
+        kept silent for the broadcast turnaround delay, giving every slave time to
+        process it before the next request.
+        """
+        await self.async_start()
+
+        wait_start = time.monotonic()
+        await self._lock.acquire(BusPriority.WRITE)
+        acquired = time.monotonic()
+        nbytes = 0
+        try:
+            if serial_cfg is not None and serial_cfg != self._serial_cfg:
+                await self._reconfigure(serial_cfg)
+
+            client = self._client
+            if client is None:
+                raise ConnectionError("RTU client not available")
+
+            method = getattr(client, name)
+            kwargs = {**kwargs, "device_id": BROADCAST_ID, "no_response_expected": True}
+            request_bytes, _ = frame_sizes(name, kwargs) or (0, 0)
+            timeout = request_bytes * char_time(self._serial_cfg) + TIMEOUT_MARGIN
+
+            try:
+                await self._run_io(self._timed_call(method, (), kwargs, timeout))
+            except asyncio.TimeoutError:
+                pass    # Sending took longer than expected, the request is out either way
+
+            nbytes = request_bytes
+            _LOGGER.debug("Broadcast %s %s on %s", name, kwargs, self.port)
+            await asyncio.sleep(BROADCAST_TURNAROUND)
+        finally:
+            self._lock.release()
+            self.metrics.record(time.monotonic() - acquired, acquired - wait_start, nbytes)
+
+    async def async_scan(self, slave_ids=SLAVE_IDS, baudrate: int | None = None) -> list[tuple[int, float]]:
+        """
+        Find the slaves answering on the bus, returning (slave ID, response latency) pairs.
+
+        Each ID gets a single one register read, with a timeout computed from the baud
+        rate. Any answer counts, also an exception response. Polling is paused during the
+        scan, while writes can still get the bus between two probes.
+        """
+        await self.async_start()
+        serial_cfg = self.serial_config_for(baudrate) if baudrate is not None else None
+
+        found = []
+        with self.scheduler.paused():
+            for slave_id in slave_ids:
+                latency = await self._scan_one(slave_id, serial_cfg)
+                if latency is not None:
+                    _LOGGER.debug("Slave %s answered on %s in %.3fs", slave_id, self.port, latency)
+                    found.append((slave_id, latency))
+
+        _LOGGER.info("Scan of %s found %d slaves: %s", self.port, len(found), [slave_id for slave_id, _ in found])
+        return found
+
+    async def _scan_one(self, slave_id: int, serial_cfg: dict | None) -> float | None:
+        kwargs = {"address": 0, "count": 1, "device_id": slave_id}
+        try:
+            _, elapsed = await self._single_request("read_holding_registers", kwargs, (SCAN_REQUEST_BYTES, SCAN_RESPONSE_BYTES), serial_cfg)
+        except (asyncio.TimeoutError, ModbusIOException):
+            return None
+        except Exception as err:
+            # Noise on the line, e.g. a garbled frame, means no usable device at this ID, not a failed scan
+            _LOGGER.debug("Scan of slave %s on %s failed: %s", slave_id, self.port, err)
+            return None
+        return elapsed
+
+    async def async_read_device_information(self, *, serial_cfg: dict | None = None, **kwargs) -> Any:
+        """
+        Read Device Identification (FC43) as a single short request, for model detection.
+
+        Many slaves don't support it and never answer, so it is not retried and does not
+        count towards the health of the slave, which would otherwise be quarantined.
+        """
+        await self.async_start()
+        response, _ = await self._single_request(
+            "read_device_information", kwargs, (DEVICE_ID_REQUEST_BYTES, DEVICE_ID_RESPONSE_BYTES), serial_cfg,
+            priority=_bus_priority.get() or BusPriority.BACKGROUND,
+        )
+        return response
+
+    async def _single_request(self, name: str, kwargs: dict, sizes: tuple[int, int], serial_cfg: dict | None, priority: BusPriority = BusPriority.BACKGROUND) -> tuple[Any, float]:
+        """One request with the timeout for a slave of unknown response delay, outside the slave health bookkeeping."""
+        wait_start = time.monotonic()
+        await self._lock.acquire(priority)
+        acquired = time.monotonic()
+        nbytes, timed_out = sizes[0], False
+        try:
+            if serial_cfg is not None and serial_cfg != self._serial_cfg:
+                await self._reconfigure(serial_cfg)
+
+            client = self._client
+            if client is None:
+                raise ConnectionError("RTU client not available")
+
+            timeout = response_timeout(self._serial_cfg, *sizes, None)
+            try:
+                response, elapsed = await self._run_io(self._timed_call(getattr(client, name), (), kwargs, timeout))
+            except (asyncio.TimeoutError, ModbusIOException):
+                timed_out = True
+                raise
+
+            nbytes += sizes[1]
+            return response, elapsed
+        finally:
+            self._lock.release()
+            self.metrics.record(time.monotonic() - acquired, acquired - wait_start, nbytes, timed_out)
+
+    async def _probe(self, client, slave_id: int, health: _SlaveHealth) -> None:
+        """Single short read to find out if a quarantined slave is back. Any answer, even an exception, will do."""
+        start = time.monotonic()
+        try:
+            await self._transact(client, "read_holding_registers", (), {"address": 0, "count": 1, "device_id": slave_id})
+        except (asyncio.TimeoutError, ModbusIOException):
+            health.record_failure(time.monotonic(), time.monotonic() - start)
+            _LOGGER.debug("Slave %s on %s still not answering, next probe in %.0fs", slave_id, self.port, health.backoff)
+            raise SlaveQuarantinedError(f"Slave {slave_id} on {self.port} is quarantined") from None
+
+        _LOGGER.info("Slave %s on %s is answering again", slave_id, self.port)
+        health.record_success()
+
+    async def _transact(self, client, name: str, args, kwargs) -> Any:
+        """One transaction with a computed timeout, learning the response delay of the slave."""
+        method = getattr(client, name)
+        slave_id = kwargs.get("device_id")
+        sizes = frame_sizes(name, kwargs)
+        timeout = self._request_timeout(slave_id, sizes)
+
+        try:
+            response, elapsed = await self._run_io(self._timed_call(method, args, kwargs, timeout))
+        except asyncio.TimeoutError:
+            _LOGGER.debug("No response from slave %s on %s within %.3fs", slave_id, self.port, timeout)
+            raise
+
+        # Learn how long the slave takes to answer, beyond the time on the wire
+        if sizes is not None and slave_id in self._slave_timing and not response.isError():
+            wire = sum(sizes) * char_time(self._serial_cfg)
+            self._slave_timing[slave_id].record_response(max(elapsed - wire, 0.0))
+
+        return response
 
 
 class RTUBusClient:
@@ -106,8 +625,9 @@ class RTUBusClient:
     through a shared RTUBusManager.
     """
 
-    def __init__(self, bus: RTUBusManager) -> None:
+    def __init__(self, bus: RTUBusManager, baudrate: int | None = None) -> None:
         self._bus = bus
+        self._serial_cfg = bus.serial_config_for(baudrate) if baudrate is not None else None
 
     # ------------------------------
     # Explicit lifecycle methods
@@ -117,7 +637,7 @@ class RTUBusClient:
         """Ensure the RTU bus is started."""
         await self._bus.async_start()
 
-    async def close(self) -> None:
+    def close(self) -> None:
         """
         NO-OP.
 
@@ -129,6 +649,13 @@ class RTUBusClient:
     def connected(self) -> bool:
         return self._bus._client is not None
 
+    def set_response_delay(self, slave_id: int, delay: float) -> None:
+        self._bus.set_response_delay(slave_id, delay)
+
+    async def read_device_information(self, **kwargs) -> Any:
+        """Single short request, see RTUBusManager.async_read_device_information."""
+        return await self._bus.async_read_device_information(serial_cfg=self._serial_cfg, **kwargs)
+
     # ------------------------------
     # Dynamic method proxying
     # ------------------------------
@@ -143,17 +670,9 @@ class RTUBusClient:
             raise AttributeError(name)
 
         async def proxy(*args, **kwargs):
-            await self._bus.async_start()
-
-            client = self._bus._client
-            if client is None:
-                raise ConnectionError("RTU client not available")
-
-            method = getattr(client, name)
-            if not callable(method):
-                return method
-
-            async with self._bus._lock:
-                return await method(*args, **kwargs)
+            priority = _bus_priority.get()
+            if priority is None:
+                priority = BusPriority.WRITE if name.startswith("write") else BusPriority.POLL
+            return await self._bus._execute(name, *args, priority=priority, serial_cfg=self._serial_cfg, **kwargs)
 
         return proxy
@@ -0,0 +1,31 @@
+"""Scan of an RTU bus for answering slaves, used by the config flow and the scan service."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .rtu_bus import RTUBusManager, SLAVE_IDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_scan_port(hass: HomeAssistant, port: str, baudrate: int, slave_ids=SLAVE_IDS) -> list[dict]:
+    """
+    Scan a serial port, returning the answering slaves with their response latency.
+
+    A port already in use is scanned through its bus, pausing its polling. Otherwise
+    the port is opened only for the scan.
+    """
+    bus = hass.data.get(DOMAIN, {}).get("rtu_buses", {}).get(port)
+    if bus is not None:
+        found = await bus.async_scan(slave_ids, baudrate)
+    else:
+        bus = RTUBusManager(hass=hass, port=port, baudrate=baudrate, bytesize=8, parity="N", stopbits=1, timeout=3.0)
+        try:
+            found = await bus.async_scan(slave_ids)
+        finally:
+            await bus.async_stop()
+
+    return [{"slave_id": slave_id, "latency": round(latency, 4)} for slave_id, latency in found]
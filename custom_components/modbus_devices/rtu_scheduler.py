@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .rtu_timing import estimate_read_time
+
+if TYPE_CHECKING:
+    from .coordinator import ModbusCoordinator
+    from .devices.datatypes import ModbusGroup
+    from .rtu_bus import RTUBusManager
+
+_LOGGER = logging.getLogger(__name__)
+
+UTILIZATION_TARGET = 0.9        # Share of bus time that periodic polling may use, rest is for writes
+MAX_STRETCH = 10.0              # Longest a task's interval is stretched when the bus is oversubscribed
+COST_SMOOTHING = 0.2            # Weight of the newest measurement in the bus time estimate
+BAUD_SWITCH_SLACK = 2.0         # Seconds a task at another baud rate may be past its deadline before the port is switched for it
+
+
+@dataclass
+class PollTaskStats:
+    polls: int = 0
+    deadline_misses: int = 0
+    jitter_avg: float = 0.0     # Seconds between release and start, moving average
+    jitter_max: float = 0.0
+
+
+@dataclass
+class _PollTask:
+    """One (device, group) pair, polled periodically."""
+    coordinator: ModbusCoordinator
+    group: ModbusGroup
+    slave_id: int
+    baudrate: int
+    base_period: float          # Interval asked for by the device, seconds
+    period: float               # Interval actually used, may be stretched
+    cost: float                 # Estimated bus time per poll, seconds
+    release: float              # Event loop time the task becomes ready
+    stats: PollTaskStats = field(default_factory=PollTaskStats)
+
+    @property
+    def deadline(self) -> float:
+        return self.release + self.period
+
+    @property
+    def priority(self) -> int:
+        return self.group.priority
+
+
+class RTUBusScheduler:
+    """
+    Polls every device on one RTU bus from a single loop.
+
+    Each polled group of each device is a periodic task, with its deadline at
+    the end of its period. The task with the earliest deadline is read next
+    (EDF), back-to-back while tasks are ready, so the bus is used fully without
+    devices piling up on the bus lock.
+
+    Bus time of each task is estimated from the baud rate and frame sizes, and
+    then learned from measurements. If the tasks need more bus time than
+    available, the intervals of the lowest priority groups are stretched first,
+    so that overload degrades predictably instead of making every device late.
+    """
+
+    def __init__(self, bus: RTUBusManager) -> None:
+        self._bus = bus
+        self.hass = bus.hass
+        self.port = bus.port
+
+        self._tasks: list[_PollTask] = []
+        self._slave_ids: dict[ModbusCoordinator, int] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._overloaded = False
+        self._paused = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, coordinator: ModbusCoordinator, slave_id: int) -> None:
+        """Add the groups of a device. They are first due on the device's next phase, as the first refresh is already done."""
+        self._slave_ids[coordinator] = slave_id
+
+        for group in coordinator.poll_groups():
+            period = coordinator.group_interval(group)
+            self._tasks.append(_PollTask(
+                coordinator=coordinator,
+                group=group,
+                slave_id=slave_id,
+                baudrate=coordinator.connection_params.baud_rate,
+                base_period=period,
+                period=period,
+                cost=self._estimate_cost(coordinator, group),
+                release=coordinator.next_phase_time(period),
+            ))
+        _LOGGER.debug("Scheduling slave %s on %s, %d groups", slave_id, self.port, len(coordinator.poll_groups()))
+
+        self._rebalance()
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(self._run(), name=f"modbus_rtu_scheduler {self.port}")
+        self._wakeup.set()
+
+    def unregister(self, coordinator: ModbusCoordinator) -> None:
+        self._tasks = [task for task in self._tasks if task.coordinator is not coordinator]
+        self._slave_ids.pop(coordinator, None)
+        self._rebalance()
+
+        if not self._tasks and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def update_intervals(self, coordinator: ModbusCoordinator) -> None:
+        """Pick up changed intervals of a device, taking effect on its next phase if they got shorter."""
+        for task in self._tasks:
+            if task.coordinator is coordinator:
+                task.base_period = coordinator.group_interval(task.group)
+                task.release = min(task.release, coordinator.next_phase_time(task.base_period))
+
+        self._rebalance()
+        self._wakeup.set()
+
+    def stats(self, coordinator: ModbusCoordinator) -> list[dict]:
+        """Scheduling statistics of the groups of one device, for diagnostics."""
+        return [
+            {
+                "group": index,
+                "period": task.period,
+                "base_period": task.base_period,
+                "cost": task.cost,
+                "polls": task.stats.polls,
+                "deadline_misses": task.stats.deadline_misses,
+                "jitter_avg": task.stats.jitter_avg,
+                "jitter_max": task.stats.jitter_max,
+            }
+            for index, task in enumerate(task for task in self._tasks if task.coordinator is coordinator)
+        ]
+
+    @contextmanager
+    def paused(self):
+        """Stop polling inside the block, e.g. while the bus is scanned. Missed polls are not caught up."""
+        self._paused += 1
+        try:
+            yield
+        finally:
+            self._paused -= 1
+            self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Bus time budget
+    # ------------------------------------------------------------------
+
+    def _estimate_cost(self, coordinator: ModbusCoordinator, group: ModbusGroup) -> float:
+        serial_cfg = self._bus.serial_config_for(coordinator.connection_params.baud_rate)
+        return sum(
+            estimate_read_time(serial_cfg, group.mode, block.count)
+            for block in coordinator._modbusDevice.planGroup(group)
+        )
+
+    def _rebalance(self) -> None:
+        """Stretch intervals of low priority tasks until the bus utilization fits."""
+        for task in self._tasks:
+            task.period = task.base_period
+
+        utilization = sum(task.cost / task.base_period for task in self._tasks)
+        excess = utilization - UTILIZATION_TARGET
+
+        if excess <= 0:
+            if self._overloaded:
+                _LOGGER.info("Bus %s no longer oversubscribed (%.0f%% utilization)", self.port, utilization * 100)
+                self._overloaded = False
+            return
+
+        for priority in sorted({task.priority for task in self._tasks}):
+            tier = [task for task in self._tasks if task.priority == priority]
+            tier_utilization = sum(task.cost / task.base_period for task in tier)
+
+            # Stretching every period in the tier by a factor divides its utilization by the same factor
+            saving = min(excess, tier_utilization * (1 - 1 / MAX_STRETCH))
+            factor = tier_utilization / (tier_utilization - saving)
+            for task in tier:
+                task.period = task.base_period * factor
+
+            excess -= saving
+            if excess <= 0:
+                break
+
+        if not self._overloaded:
+            _LOGGER.warning(
+                "Bus %s is oversubscribed (%.0f%% utilization), stretching poll intervals of low priority groups",
+                self.port, utilization * 100,
+            )
+            self._overloaded = True
+
+    # ------------------------------------------------------------------
+    # Poll loop
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        loop = self.hass.loop
+
+        while self._tasks:
+            self._wakeup.clear()
+
+            if self._paused:
+                await self._wakeup.wait()
+                continue
+
+            now = loop.time()
+            ready = [task for task in self._tasks if task.release <= now]
+            if not ready:
+                delay = min(task.release for task in self._tasks) - now
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # Earliest deadline first, ties broken by priority and then slave ID for a stable order.
+            # Ready tasks using the current serial settings go first, so the port is reconfigured
+            # once per batch instead of once per task on a bus with mixed baud rates. Only until
+            # a task at another baud rate is overdue by the slack, so no baud rate is starved.
+            baudrate = self._bus.serial_config["baudrate"]
+            batching = not any(task.baudrate != baudrate and now - task.deadline > BAUD_SWITCH_SLACK for task in ready)
+            task = min(ready, key=lambda task: (batching and task.baudrate != baudrate, task.deadline, -task.priority, task.slave_id))
+            await self._poll(task)
+
+    async def _poll(self, task: _PollTask) -> None:
+        loop = self.hass.loop
+
+        start = loop.time()
+        try:
+            await task.coordinator.async_poll_group(task.group)
+        except Exception:
+            # Never let one device stop the loop for the whole bus. Try again next period.
+            _LOGGER.exception("Polling slave %s on %s failed", task.slave_id, self.port)
+            task.release = max(task.release + task.period, loop.time())
+            return
+        end = loop.time()
+
+        if task not in self._tasks:
+            return      # Unloaded while polling
+
+        stats = task.stats
+        jitter = start - task.release
+        stats.polls += 1
+        stats.jitter_avg += (jitter - stats.jitter_avg) / min(stats.polls, 20)
+        stats.jitter_max = max(stats.jitter_max, jitter)
+        if end > task.deadline:
+            stats.deadline_misses += 1
+            _LOGGER.debug(
+                "Deadline missed on %s for slave %s by %.3fs (jitter %.3fs)",
+                self.port, task.slave_id, end - task.deadline, jitter,
+            )
+
+        # Learn the actual bus time, which includes turnaround of the slave
+        task.cost += COST_SMOOTHING * ((end - start) - task.cost)
+        self._rebalance()
+
+        # Keep the phase, but skip releases that were missed instead of catching up
+        task.release += task.period
+        if task.release < end:
+            task.release = end
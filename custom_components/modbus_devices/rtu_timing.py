@@ -0,0 +1,84 @@
+"""Timing of Modbus RTU frames, computed from the serial settings."""
+from __future__ import annotations
+
+import math
+
+from .devices.const import ModbusMode
+
+READ_REQUEST_BYTES = 8          # Slave, function, address (2), count (2), CRC (2)
+RESPONSE_OVERHEAD_BYTES = 5     # Slave, function, byte count, CRC (2)
+WRITE_SINGLE_BYTES = 8          # Request and echoed response of FC5/FC6
+WRITE_MULTIPLE_OVERHEAD = 9     # Slave, function, address (2), count (2), byte count, CRC (2)
+DEFAULT_TURNAROUND = 0.010      # Seconds a typical slave needs before it answers
+BROADCAST_TURNAROUND = 0.2      # Seconds the bus stays silent after a broadcast, so all slaves can process it
+
+# Above 19200 baud the specification fixes the silent interval instead of scaling it
+FIXED_GAP_BAUDRATE = 19200
+FIXED_INTER_FRAME_GAP = 0.00175
+
+# Allowance for a slave whose response delay is unknown, used only when scanning the bus and
+# probing for optional functions: a missing slave then costs tens of milliseconds instead
+# of the full client timeout.
+UNLEARNED_RESPONSE_DELAY = 0.05
+TIMEOUT_MARGIN = 0.02           # Seconds added to every computed timeout for OS and USB latency
+RESPONSE_DELAY_FACTOR = 2.0     # Headroom over the learned response delay
+SCAN_REQUEST_BYTES = READ_REQUEST_BYTES
+SCAN_RESPONSE_BYTES = RESPONSE_OVERHEAD_BYTES + 2  # One register
+DEVICE_ID_REQUEST_BYTES = 7     # Slave, function, MEI type, read code, object ID, CRC (2)
+DEVICE_ID_RESPONSE_BYTES = 256  # Largest RTU frame, the size of the objects is not known up front
+
+
+def char_time(serial_cfg: dict) -> float:
+    """Seconds needed to send one character, including start, parity and stop bits."""
+    bits = 1 + serial_cfg["bytesize"] + (0 if serial_cfg["parity"] == "N" else 1) + serial_cfg["stopbits"]
+    return bits / serial_cfg["baudrate"]
+
+
+def inter_frame_gap(serial_cfg: dict) -> float:
+    """Minimum silent interval between two frames (3.5 characters)."""
+    if serial_cfg["baudrate"] > FIXED_GAP_BAUDRATE:
+        return FIXED_INTER_FRAME_GAP
+    return 3.5 * char_time(serial_cfg)
+
+
+def read_response_bytes(mode: ModbusMode, count: int) -> int:
+    """Size of the response frame to a read of count registers or bits."""
+    if mode in (ModbusMode.COILS, ModbusMode.DISCRETE_INPUTS):
+        return RESPONSE_OVERHEAD_BYTES + math.ceil(count / 8)
+    return RESPONSE_OVERHEAD_BYTES + 2 * count
+
+
+def frame_sizes(name: str, kwargs: dict) -> tuple[int, int] | None:
+    """Request and response size in bytes of a pymodbus client call, None if unknown."""
+    count = kwargs.get("count", 1)
+    values = kwargs.get("values") or []
+
+    if name in ("read_holding_registers", "read_input_registers"):
+        return READ_REQUEST_BYTES, read_response_bytes(ModbusMode.HOLDING, count)
+    if name in ("read_coils", "read_discrete_inputs"):
+        return READ_REQUEST_BYTES, read_response_bytes(ModbusMode.COILS, count)
+    if name in ("write_register", "write_coil"):
+        return WRITE_SINGLE_BYTES, WRITE_SINGLE_BYTES
+    if name == "write_registers":
+        return WRITE_MULTIPLE_OVERHEAD + 2 * len(values), READ_REQUEST_BYTES
+    if name == "write_coils":
+        return WRITE_MULTIPLE_OVERHEAD + math.ceil(len(values) / 8), READ_REQUEST_BYTES
+    return None
+
+
+def estimate_read_time(serial_cfg: dict, mode: ModbusMode, count: int, turnaround: float = DEFAULT_TURNAROUND) -> float:
+    """Estimated bus time of one read transaction, from request start to end of response."""
+    chars = READ_REQUEST_BYTES + read_response_bytes(mode, count)
+    return chars * char_time(serial_cfg) + turnaround
+
+
+def response_timeout(serial_cfg: dict, request_bytes: int, response_bytes: int, response_delay: float | None) -> float:
+    """
+    Time to wait for a response, from the start of the request.
+
+    Covers sending the request, the slave's response delay with some headroom,
+    and receiving the response.
+    """
+    wire = (request_bytes + response_bytes) * char_time(serial_cfg) + 2 * inter_frame_gap(serial_cfg)
+    delay = UNLEARNED_RESPONSE_DELAY if response_delay is None else response_delay * RESPONSE_DELAY_FACTOR
+    return wire + delay + TIMEOUT_MARGIN
@@ -77,11 +77,10 @@ class ModbusSelectEntity(ModbusBaseEntity, SelectEntity):
         try:
             if self._key == "Config Selection":
                 self.config_selection = value
+                self.async_write_ha_state()
                 await self.coordinator.config_select(option)
             else:           
                 _LOGGER.debug("Writing")
                 await self.coordinator.write_value(self._group, self._key, value)
         except Exception as err:
             _LOGGER.debug("Error writing command: %s %s", self._group, self._key, exc_info=True)
-        finally:
-            self.async_schedule_update_ha_state(force_refresh=False)
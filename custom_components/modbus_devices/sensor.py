@@ -1,6 +1,7 @@
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription, SensorStateClass
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 
 from .const import DOMAIN
 from .coordinator import ModbusCoordinator
@@ -10,6 +11,17 @@ from .devices.datatypes import ModbusGroup, ModbusDefaultGroups, ModbusDatapoint
 
 _LOGGER = logging.getLogger(__name__)
 
+# Load metrics of a shared RTU bus, polled from the bus instead of read from a device
+BUS_SENSORS = (
+    SensorEntityDescription(key="utilization", name="Utilization", native_unit_of_measurement=PERCENTAGE, suggested_display_precision=1),
+    SensorEntityDescription(key="idle_time", name="Idle time", native_unit_of_measurement=UnitOfTime.SECONDS, suggested_display_precision=1),
+    SensorEntityDescription(key="lock_wait_avg", name="Queue wait average", native_unit_of_measurement=UnitOfTime.SECONDS, suggested_display_precision=3),
+    SensorEntityDescription(key="lock_wait_max", name="Queue wait max", native_unit_of_measurement=UnitOfTime.SECONDS, suggested_display_precision=3),
+    SensorEntityDescription(key="transactions_per_second", name="Transactions per second", native_unit_of_measurement="tx/s", suggested_display_precision=1),
+    SensorEntityDescription(key="bytes_per_second", name="Bytes per second", native_unit_of_measurement="B/s", suggested_display_precision=0),
+    SensorEntityDescription(key="timeouts", name="Timeouts", native_unit_of_measurement="timeouts/min", suggested_display_precision=0),
+)
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup sensor from a config entry created in the integrations UI."""
     # Find coordinator for this device
@@ -25,6 +37,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     async_add_entities(ha_entities, False)
 
+    # One device on each RTU bus carries the sensors of the bus itself, chosen by the bus
+    rtu_bus = coordinator.rtu_bus
+    if rtu_bus is not None:
+        rtu_bus.register_sensor_platform(
+            config_entry.entry_id,
+            lambda: async_add_entities([ModbusBusSensorEntity(rtu_bus, description) for description in BUS_SENSORS], False),
+        )
+
 class ModbusSensorEntity(ModbusBaseEntity, SensorEntity):
     """Representation of a Sensor."""
 
@@ -56,4 +76,26 @@ class ModbusSensorEntity(ModbusBaseEntity, SensorEntity):
                 return val
         else:
             # If no enum, return the raw value
-            return val
\ No newline at end of file
+            return val
+
+class ModbusBusSensorEntity(SensorEntity):
+    """Load metric of an RTU bus, on a device representing the bus."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+
+    def __init__(self, rtu_bus, description: SensorEntityDescription):
+        self.entity_description = description
+        self._metrics = rtu_bus.metrics
+        self._attr_unique_id = "rtu_bus-{}-{}".format(rtu_bus.port, description.key)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "rtu_bus-{}".format(rtu_bus.port))},
+            "name": "Modbus RTU {}".format(rtu_bus.port),
+            "model": "RTU bus",
+        }
+
+    @property
+    def native_value(self):
+        return self._metrics.snapshot()[self.entity_description.key]
@@ -0,0 +1,125 @@
+"""Persistent cache shared by all Modbus Devices config entries."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.cache"
+SAVE_DELAY = 10  # Seconds, batches writes from several devices into one save
+
+
+class ModbusDevicesStore:
+    """Small key/value cache persisted in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+        # Drop expired writes, also of devices that were removed meanwhile
+        now = time.time()
+        queues = self._data.get("write_queue", {})
+        for device_key in list(queues):
+            queues[device_key] = [entry for entry in queues[device_key] if entry["expires"] > now]
+            if not queues[device_key]:
+                del queues[device_key]
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    # ------------------------------------------------------------------
+    # Max registers per read, keyed by endpoint
+    # ------------------------------------------------------------------
+
+    def get_max_registers(self, endpoint_key: str) -> int | None:
+        return self._data.get("max_registers", {}).get(endpoint_key)
+
+    def set_max_registers(self, endpoint_key: str, count: int) -> None:
+        limits = self._data.setdefault("max_registers", {})
+        if limits.get(endpoint_key) != count:
+            limits[endpoint_key] = count
+            self._schedule_save()
+
+    def get_accepted_registers(self, endpoint_key: str) -> int | None:
+        """Largest read known to work where no limit was found, a lower bound of the real limit."""
+        return self._data.get("accepted_registers", {}).get(endpoint_key)
+
+    def set_accepted_registers(self, endpoint_key: str, count: int) -> None:
+        accepted = self._data.setdefault("accepted_registers", {})
+        if count > accepted.get(endpoint_key, 0):
+            accepted[endpoint_key] = count
+            self._schedule_save()
+
+    # ------------------------------------------------------------------
+    # Writes queued while a device is unreachable, keyed by device
+    # ------------------------------------------------------------------
+
+    def get_write_queue(self, device_key: str) -> list[dict]:
+        return self._data.get("write_queue", {}).get(device_key, [])
+
+    def set_write_queue(self, device_key: str, entries: list[dict]) -> None:
+        queues = self._data.setdefault("write_queue", {})
+        if queues.get(device_key, []) == entries:
+            return
+        if entries:
+            queues[device_key] = entries
+        else:
+            queues.pop(device_key, None)
+        self._schedule_save()
+
+    # ------------------------------------------------------------------
+    # Values of POLL_ONCE groups, keyed by config entry
+    # ------------------------------------------------------------------
+
+    def get_static_values(self, entry_id: str) -> dict | None:
+        return self._data.get("static_values", {}).get(entry_id)
+
+    def set_static_values(self, entry_id: str, snapshot: dict) -> None:
+        values = self._data.setdefault("static_values", {})
+        if values.get(entry_id) != snapshot:
+            values[entry_id] = snapshot
+            self._schedule_save()
+
+    # ------------------------------------------------------------------
+    # Values of POLL_ON groups at shutdown, keyed by config entry
+    # ------------------------------------------------------------------
+
+    def get_polled_values(self, entry_id: str) -> dict | None:
+        return self._data.get("polled_values", {}).get(entry_id)
+
+    def set_polled_values(self, entry_id: str, snapshot: dict) -> None:
+        values = self._data.setdefault("polled_values", {})
+        if values.get(entry_id) != snapshot:
+            values[entry_id] = snapshot
+            self._schedule_save()
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Drop the cached values of a removed config entry."""
+        removed = [self._data.get(section, {}).pop(entry_id, None) for section in ("static_values", "polled_values")]
+        if any(value is not None for value in removed):
+            self._schedule_save()
+
+
+async def async_get_store(hass: HomeAssistant) -> ModbusDevicesStore:
+    """Return the shared store, loading it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+
+    # Entries set up at the same time must share one instance, or they overwrite each other's data
+    async with data.setdefault("store_lock", asyncio.Lock()):
+        store = data.get("store")
+        if store is None:
+            store = ModbusDevicesStore(hass)
+            await store.async_load()
+            data["store"] = store
+    return store
@@ -0,0 +1,92 @@
+"""Compare poll cycle latency of Modbus/TCP and Modbus/UDP against a local stand-in server.
+
+Usage:
+    python scripts/benchmark_transport.py [--cycles 500] [--groups 5] [--registers 40]
+
+A pymodbus server is started on localhost for each transport, then the client reads
+a number of register blocks per cycle, the same way a ModbusDevice polls its groups.
+The results are only meaningful relative to each other, the absolute numbers on a
+real LAN will be higher.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
+from pymodbus.datastore import ModbusDeviceContext, ModbusSequentialDataBlock, ModbusServerContext
+from pymodbus.server import ModbusTcpServer, ModbusUdpServer
+
+HOST = "127.0.0.1"
+TCP_PORT = 15020
+UDP_PORT = 15021
+
+
+def make_context(size: int) -> ModbusServerContext:
+    device = ModbusDeviceContext(
+        hr=ModbusSequentialDataBlock(0, list(range(size))),
+        ir=ModbusSequentialDataBlock(0, list(range(size))),
+    )
+    return ModbusServerContext(devices=device, single=True)
+
+
+async def run_cycles(client, cycles: int, groups: int, registers: int) -> list[float]:
+    await client.connect()
+    if not client.connected:
+        raise ConnectionError(f"Could not connect {client}")
+
+    durations = []
+    try:
+        for _ in range(cycles):
+            start = time.perf_counter()
+            for group in range(groups):
+                response = await client.read_holding_registers(address=group * registers, count=registers, device_id=1)
+                if response.isError():
+                    raise RuntimeError(f"Read failed: {response}")
+            durations.append(time.perf_counter() - start)
+    finally:
+        client.close()
+
+    return durations
+
+
+async def benchmark(name: str, server, client, args) -> None:
+    task = asyncio.create_task(server.serve_forever())
+    await asyncio.sleep(0.2)
+
+    try:
+        durations = await run_cycles(client, args.cycles, args.groups, args.registers)
+    finally:
+        await server.shutdown()
+        task.cancel()
+
+    durations.sort()
+    p95 = durations[int(len(durations) * 0.95) - 1]
+    print(
+        f"{name:4} cycles={len(durations)} "
+        f"mean={statistics.mean(durations) * 1000:.2f} ms "
+        f"median={statistics.median(durations) * 1000:.2f} ms "
+        f"p95={p95 * 1000:.2f} ms "
+        f"max={durations[-1] * 1000:.2f} ms"
+    )
+
+
+async def main(args) -> None:
+    context = make_context(args.groups * args.registers)
+
+    tcp_server = ModbusTcpServer(context, address=(HOST, TCP_PORT))
+    tcp_client = AsyncModbusTcpClient(host=HOST, port=TCP_PORT, retries=0)
+    await benchmark("TCP", tcp_server, tcp_client, args)
+
+    # Same defaults as UDPConnectionParams
+    udp_server = ModbusUdpServer(context, address=(HOST, UDP_PORT))
+    udp_client = AsyncModbusUdpClient(host=HOST, port=UDP_PORT, timeout=0.5, retries=0)
+    await benchmark("UDP", udp_server, udp_client, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=500, help="Number of poll cycles per transport")
+    parser.add_argument("--groups", type=int, default=5, help="Number of register blocks read per cycle")
+    parser.add_argument("--registers", type=int, default=40, help="Registers per block (max 125)")
+    asyncio.run(main(parser.parse_args()))